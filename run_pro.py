@@ -6,8 +6,6 @@ Main application entry point with modern UI
 
 import sys
 import os
-import threading
-import time
 from pathlib import Path
 
 # Add the src directory to the Python path
@@ -16,11 +14,11 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from src.ui.main_window import MainWindow
 from src.utils.logger import get_logger
 
+logger = get_logger()
+
 
 def main():
     """Main application entry point"""
-    # Initialize logging
-    logger = get_logger()
     logger.info("Desktop Manager Pro starting...")
     
     try:
@@ -1,15 +1,45 @@
+import ctypes
+import os
 import threading
 import time
+from ctypes import wintypes
 import win32gui
 import win32con
 import win32api
 import pythoncom
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, List, Tuple
 from ..utils.logger import get_logger
-from ..utils.win32_helpers import get_window_info, is_system_window
+from ..utils.win32_helpers import get_window_info, SYSTEM_WINDOW_CLASSES
+from ..utils.cache import cache
+from .window_manager import get_window_class, get_window_process_id, invalidate_window, get_cache_stats
 
 logger = get_logger(__name__)
 
+# SetWinEventHook is not wrapped by pywin32, so it is called through ctypes
+user32 = ctypes.windll.user32
+WinEventProcType = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+user32.SetWinEventHook.restype = wintypes.HANDLE
+user32.SetWinEventHook.argtypes = [
+    wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProcType,
+    wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+]
+user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+
+# Event ranges that can change the set of tracked windows; noisy events in
+# between (focus, selection, location changes) are deliberately not hooked
+HOOK_EVENT_RANGES = [
+    (win32con.EVENT_OBJECT_CREATE, win32con.EVENT_OBJECT_HIDE),
+    (win32con.EVENT_OBJECT_NAMECHANGE, win32con.EVENT_OBJECT_NAMECHANGE)
+]
+
 
 class EventMonitor:
     """
@@ -21,16 +51,33 @@ class EventMonitor:
         Initialize the event monitor.
         
         Args:
-            event_callback: Function to call when events occur. 
+            event_callback: Function to call when events occur.
                           Signature: callback(event_id, hwnd, window_info)
         """
         self.event_callback = event_callback
         self.monitoring_thread: Optional[threading.Thread] = None
         self.thread_id: Optional[int] = None
-        self.hook_handle: Optional[int] = None
+        self.hook_handles: List[int] = []
+        self._hook_proc = None  # Keeps the ctypes callback alive while hooked
+        self._windows: Dict[int, Tuple[str, str]] = {}  # hwnd -> (title, class_name)
+        self._scan_windows: Dict[int, Tuple[str, str]] = {}  # Spare dict reused by each poll
+        # The hooks skip this process's own windows (WINEVENT_SKIPOWNPROCESS), so window
+        # scans must skip them too; otherwise they'd be tracked but never reported closed
+        self._own_pid = os.getpid()
+        self._skip_own_windows = False
         self.running = False
+        self._stop_event = threading.Event()  # Wakes the polling loop on stop()
+        self._started_event = threading.Event()  # Set once the thread is monitoring
         self.polling_interval = 3.0  # Default polling interval
+        self.max_polling_interval = 30.0  # Upper bound for the idle back-off
         self.interval_lock = threading.Lock()  # Thread-safe interval changes
+        self.current_interval = self.polling_interval  # Interval after idle back-off
+        
+        # Poll telemetry, reported by get_status()
+        self.poll_count = 0
+        self.idle_polls = 0  # Consecutive polls that found no changes
+        self.avg_enum_ms = 0.0  # Moving average of EnumWindows time
+        self.stats_log_interval = 100  # Polls between telemetry log lines
         
         # Event type mapping
         self.event_types = {
@@ -44,13 +91,17 @@ class EventMonitor:
             win32con.EVENT_OBJECT_VALUECHANGE: "VALUECHANGE"
         }
         
-        logger.info("EventMonitor initialized")
+        if __debug__:
+            logger.info("EventMonitor initialized")
     
-    def _event_hook_callback(self, hWinEventHook: int, event: int, hwnd: int, 
-                           idObject: int, idChild: int, dwEventThread: int, 
+    def _event_hook_callback(self, hWinEventHook: int, event: int, hwnd: int,
+                           idObject: int, idChild: int, dwEventThread: int,
                            dwmsEventTime: int) -> None:
         """
-        Static method that SetWinEventHook calls when events occur.
+        WinEventProc that SetWinEventHook calls when events occur.
+        
+        Re-reads the window the event refers to and reports the same
+        CREATE/DESTROY/NAMECHANGE transitions the polling loop would.
         
         Args:
             hWinEventHook: Handle to the event hook
@@ -62,30 +113,189 @@ class EventMonitor:
             dwmsEventTime: Event time
         """
         try:
-            # Filter out system windows and invalid handles
-            if not hwnd or is_system_window(hwnd):
+            # Only whole-window events; child objects (carets, list items, ...) are ignored
+            if not hwnd or idObject != OBJID_WINDOW or idChild != CHILDID_SELF:
                 return
-                
-            # Get event type name
-            event_name = self.event_types.get(event, f"UNKNOWN_{event}")
             
-            # Get window information
-            window_info = get_window_info(hwnd)
+            if event == win32con.EVENT_OBJECT_DESTROY:
+                invalidate_window(hwnd)
             
-            # Log the event (debug level to avoid spam)
-            logger.debug(f"Event: {event_name} - Window: {window_info.get('title', 'Unknown')} "
-                        f"(HWND: {hwnd}, Class: {window_info.get('class_name', 'Unknown')})")
+            previous = self._windows.get(hwnd)
+            current = self._read_window(hwnd)
+            if previous is None and current is None:
+                return
             
-            # Call the event callback
-            self.event_callback(event, hwnd, window_info)
+            logger.debug("Event: %s - Window: %s (HWND: %s)",
+                         self.event_types.get(event, f"UNKNOWN_{event}"),
+                         (current or previous)[0], hwnd)
             
+            if current is None:
+                del self._windows[hwnd]
+            else:
+                self._windows[hwnd] = current
+            self._dispatch_window_change(hwnd, previous, current)
+        
         except Exception as e:
             logger.error(f"Error in event hook callback: {e}")
     
+    def _read_window(self, hwnd: int) -> Optional[Tuple[str, str]]:
+        """
+        Read the basic information tracked for a window.
+        
+        Args:
+            hwnd: Window handle
+        
+        Returns:
+            tuple: (title, class_name), or None if the window is not a
+            visible, titled, top-level application window
+        """
+        if win32gui.IsWindowVisible(hwnd) and win32gui.GetParent(hwnd) == 0:
+            # Get basic info only (avoid expensive operations)
+            try:
+                # Class names are cached per hwnd, so only the title is re-read
+                class_name = get_window_class(hwnd)
+                if class_name not in SYSTEM_WINDOW_CLASSES:
+                    title = win32gui.GetWindowText(hwnd)
+                    if title:  # Only track windows with titles
+                        return title, class_name
+            except Exception:
+                pass  # Skip problematic windows
+        return None
+    
+    def _dispatch_window_change(self, hwnd: int, previous: Optional[Tuple[str, str]],
+                                current: Optional[Tuple[str, str]]) -> None:
+        """
+        Report a change in a tracked window to the event callback.
+        
+        Args:
+            hwnd: Window handle
+            previous: (title, class_name) before the change, None if it was untracked
+            current: (title, class_name) after the change, None if it is no longer tracked
+        """
+        if previous is None:
+            logger.debug("Detected new window: %s (HWND: %s)", current[0], hwnd)
+            # Get full window info only when we detect a new window
+            window_info = get_window_info(hwnd)
+            if window_info:
+                self.event_callback(win32con.EVENT_OBJECT_CREATE, hwnd,
+                                    {**window_info, 'title': current[0], 'class_name': current[1]})
+        
+        elif current is None:
+            logger.debug("Detected closed window (HWND: %s)", hwnd)
+            # Create minimal window info for closed window
+            window_info = {
+                'hwnd': hwnd,
+                'title': previous[0],
+                'class_name': previous[1],
+                'pid': None,
+                'exe_path': None,
+                'is_visible': False,
+                'is_top_level': False,
+                'window_state': win32con.SW_SHOWNORMAL
+            }
+            self.event_callback(win32con.EVENT_OBJECT_DESTROY, hwnd, window_info)
+        
+        elif current != previous:
+            logger.debug("Detected changed window: %s (HWND: %s)", current[0], hwnd)
+            # Get full window info for changed windows; the title and class just read
+            # take precedence over get_window_info's cached copy, which predates the change
+            window_info = get_window_info(hwnd)
+            if window_info:
+                self.event_callback(win32con.EVENT_OBJECT_NAMECHANGE, hwnd,
+                                    {**window_info, 'title': current[0], 'class_name': current[1]})
+    
+    def _install_hooks(self) -> bool:
+        """
+        Register the WinEvent hooks on the calling thread.
+        
+        Returns:
+            bool: True if every hook was installed
+        """
+        self._hook_proc = WinEventProcType(self._event_hook_callback)
+        for event_min, event_max in HOOK_EVENT_RANGES:
+            handle = user32.SetWinEventHook(
+                event_min, event_max, 0, self._hook_proc, 0, 0,
+                WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+            )
+            if not handle:
+                logger.warning(f"SetWinEventHook failed for events {event_min:#x}-{event_max:#x}")
+                self._remove_hooks()
+                return False
+            self.hook_handles.append(handle)
+        return True
+    
+    def _remove_hooks(self) -> None:
+        """Unregister any installed WinEvent hooks."""
+        for handle in self.hook_handles:
+            user32.UnhookWinEvent(handle)
+        self.hook_handles = []
+        self._hook_proc = None
+    
+    def _enum_window(self, hwnd: int, windows: Dict[int, Tuple[str, str]]) -> None:
+        """EnumWindows callback that records each tracked window into windows."""
+        window = self._read_window(hwnd)
+        if window:
+            if self._skip_own_windows and get_window_process_id(hwnd) == self._own_pid:
+                return
+            windows[hwnd] = window
+    
+    def _poll_windows(self) -> bool:
+        """
+        Enumerate top-level windows once and report changes since the last scan.
+        
+        Returns:
+            bool: True if any window was created, closed or changed
+        """
+        # Get current windows efficiently, into the spare dict from the last scan
+        current_windows = self._scan_windows
+        current_windows.clear()
+        
+        enum_start = time.perf_counter_ns()
+        win32gui.EnumWindows(self._enum_window, current_windows)
+        enum_ms = (time.perf_counter_ns() - enum_start) / 1e6
+        self.avg_enum_ms = enum_ms if not self.poll_count else self.avg_enum_ms * 0.8 + enum_ms * 0.2
+        self.poll_count += 1
+        previous_windows = self._windows
+        
+        # Differential update - only process changes (key views diff without copying)
+        new_windows = current_windows.keys() - previous_windows.keys()
+        closed_windows = previous_windows.keys() - current_windows.keys()
+        
+        # Check for title changes in existing windows in one pass over the current scan
+        changed_windows = [hwnd for hwnd, window in current_windows.items()
+                           if hwnd in previous_windows and previous_windows[hwnd] != window]
+        
+        # Process new windows (with full info only when needed)
+        for hwnd in new_windows:
+            self._dispatch_window_change(hwnd, None, current_windows[hwnd])
+        
+        # Process closed windows
+        for hwnd in closed_windows:
+            # The window may only be hidden; its details are simply re-read if it returns
+            invalidate_window(hwnd)
+            self._dispatch_window_change(hwnd, previous_windows[hwnd], None)
+        
+        # Process changed windows
+        for hwnd in changed_windows:
+            self._dispatch_window_change(hwnd, previous_windows[hwnd], current_windows[hwnd])
+        
+        # Update previous state by swapping buffers; the old state is reused next scan
+        self._windows, self._scan_windows = current_windows, previous_windows
+        
+        changed = bool(new_windows or closed_windows or changed_windows)
+        self.idle_polls = 0 if changed else self.idle_polls + 1
+        if self.poll_count % self.stats_log_interval == 0:
+            logger.debug("Poll %d: %.2f ms avg enum, %d idle polls, window cache %s",
+                         self.poll_count, self.avg_enum_ms, self.idle_polls, get_cache_stats())
+        
+        return changed
+    
     def _run_message_loop(self) -> None:
         """
         Method to be executed in the dedicated monitoring thread.
-        Uses optimized polling-based monitoring with differential updates.
+        Receives window events through SetWinEventHook and pumps messages until
+        stop() posts WM_QUIT. Falls back to polling with differential updates
+        if the hooks cannot be installed.
         """
         try:
             # Initialize COM for this thread
@@ -96,104 +306,64 @@ class EventMonitor:
             self.thread_id = win32api.GetCurrentThreadId()
             logger.info(f"Monitoring thread started with ID: {self.thread_id}")
             
-            logger.info("Starting optimized polling-based window monitoring...")
+            self._windows = {}
+            self._skip_own_windows = False
+            
+            if self._install_hooks():
+                self._skip_own_windows = True
+                logger.info("Monitoring window events via SetWinEventHook")
+                self._started_event.set()
+                
+                # stop() only posts WM_QUIT once hooks exist, so re-check after installing
+                if not self.running:
+                    return
+                
+                # Report the windows that already exist, then wait for events
+                self._poll_windows()
+                win32gui.PumpMessages()
+                return
             
-            # Track previous window state with more detail
-            previous_windows = {}  # hwnd -> basic_info (title, class_name)
+            if __debug__:
+                logger.info("Starting optimized polling-based window monitoring...")
+            self._started_event.set()
             
             # Polling loop
+            self.current_interval = self.get_polling_interval()
             while self.running:
                 try:
-                    # Get current windows efficiently
-                    current_windows = {}
-                    windows_list = []
-                    
-                    # Use EnumWindows with a more efficient callback
-                    def enum_callback(hwnd, windows):
-                        if win32gui.IsWindowVisible(hwnd) and win32gui.GetParent(hwnd) == 0:
-                            if not is_system_window(hwnd):
-                                # Get basic info only (avoid expensive operations)
-                                try:
-                                    title = win32gui.GetWindowText(hwnd)
-                                    class_name = win32gui.GetClassName(hwnd)
-                                    if title:  # Only track windows with titles
-                                        windows[hwnd] = {
-                                            'hwnd': hwnd,
-                                            'title': title,
-                                            'class_name': class_name
-                                        }
-                                except Exception:
-                                    pass  # Skip problematic windows
-                    
-                    win32gui.EnumWindows(enum_callback, current_windows)
-                    
-                    # Differential update - only process changes
-                    new_windows = set(current_windows.keys()) - set(previous_windows.keys())
-                    closed_windows = set(previous_windows.keys()) - set(current_windows.keys())
-                    changed_windows = set()
-                    
-                    # Check for title changes in existing windows
-                    for hwnd in set(current_windows.keys()) & set(previous_windows.keys()):
-                        if (current_windows[hwnd]['title'] != previous_windows[hwnd]['title'] or
-                            current_windows[hwnd]['class_name'] != previous_windows[hwnd]['class_name']):
-                            changed_windows.add(hwnd)
-                    
-                    # Process new windows (with full info only when needed)
-                    for hwnd in new_windows:
-                        logger.debug(f"Detected new window: {current_windows[hwnd]['title']} (HWND: {hwnd})")
-                        # Get full window info only when we detect a new window
-                        window_info = get_window_info(hwnd)
-                        if window_info:
-                            self.event_callback(win32con.EVENT_OBJECT_CREATE, hwnd, window_info)
-                    
-                    # Process closed windows
-                    for hwnd in closed_windows:
-                        logger.debug(f"Detected closed window (HWND: {hwnd})")
-                        # Create minimal window info for closed window
-                        window_info = {
-                            'hwnd': hwnd, 
-                            'title': previous_windows[hwnd]['title'], 
-                            'class_name': previous_windows[hwnd]['class_name'], 
-                            'pid': None, 
-                            'exe_path': None, 
-                            'is_visible': False, 
-                            'is_top_level': False, 
-                            'window_state': win32con.SW_SHOWNORMAL
-                        }
-                        self.event_callback(win32con.EVENT_OBJECT_DESTROY, hwnd, window_info)
-                    
-                    # Process changed windows
-                    for hwnd in changed_windows:
-                        logger.debug(f"Detected changed window: {current_windows[hwnd]['title']} (HWND: {hwnd})")
-                        # Get full window info for changed windows
-                        window_info = get_window_info(hwnd)
-                        if window_info:
-                            self.event_callback(win32con.EVENT_OBJECT_NAMECHANGE, hwnd, window_info)
-                    
-                    # Update previous state
-                    previous_windows = current_windows.copy()
+                    changed = self._poll_windows()
                     
-                    # Sleep to avoid excessive CPU usage (thread-safe interval)
+                    # Back off while nothing changes, return to the configured rate on activity
                     with self.interval_lock:
-                        current_interval = self.polling_interval
-                    time.sleep(current_interval)
+                        base_interval = self.polling_interval
+                    if changed:
+                        self.current_interval = base_interval
+                    else:
+                        self.current_interval = min(max(self.current_interval * 1.5, base_interval),
+                                                    max(self.max_polling_interval, base_interval))
                     
+                    # Wait on the stop event so stop() doesn't have to outlast the interval
+                    if self._stop_event.wait(self.current_interval):
+                        break
+                
                 except Exception as e:
                     logger.error(f"Error in polling loop: {e}")
-                    time.sleep(5)  # Wait longer on error
-                    
+                    self._stop_event.wait(5)  # Wait longer on error
+        
         except Exception as e:
             logger.error(f"Error in monitoring thread: {e}")
         finally:
             # Cleanup
             try:
+                self._remove_hooks()
                 pythoncom.CoUninitialize()
                 logger.debug("COM uninitialized")
-                
+            
             except Exception as e:
                 logger.error(f"Error during cleanup: {e}")
             
             self.running = False
+            self._started_event.set()  # Don't leave start() waiting if setup failed
             logger.info("Monitoring thread stopped")
     
     def start(self) -> bool:
@@ -206,7 +376,7 @@ class EventMonitor:
         if self.running:
             logger.warning("Event monitor is already running")
             return False
-            
+        
         try:
             # Create and start the monitoring thread
             self.monitoring_thread = threading.Thread(
@@ -215,20 +385,23 @@ class EventMonitor:
                 name="EventMonitor"
             )
             
-            self.monitoring_thread.start()
+            # Set before starting so the thread never sees a stale False
             self.running = True
+            self._stop_event.clear()
+            self._started_event.clear()
+            self.monitoring_thread.start()
             
-            # Wait a moment to ensure the thread starts
-            time.sleep(0.1)
+            # Wait until the thread is monitoring (or has failed)
+            self._started_event.wait(timeout=5.0)
             
-            if self.monitoring_thread.is_alive():
+            if self.running and self.monitoring_thread.is_alive():
                 logger.info("Event monitor started successfully")
                 return True
             else:
                 logger.error("Failed to start monitoring thread")
                 self.running = False
                 return False
-                
+        
         except Exception as e:
             logger.error(f"Error starting event monitor: {e}")
             self.running = False
@@ -244,12 +417,17 @@ class EventMonitor:
         if not self.running:
             logger.warning("Event monitor is not running")
             return False
-            
+        
         try:
             logger.info("Stopping event monitor...")
             
-            # Set running flag to False to stop the polling loop
+            # Set running flag to False and wake the polling loop
             self.running = False
+            self._stop_event.set()
+            
+            # End the message pump when running on hooks
+            if self.hook_handles and self.thread_id:
+                win32api.PostThreadMessage(self.thread_id, win32con.WM_QUIT, 0, 0)
             
             # Wait for the thread to finish (with timeout)
             if self.monitoring_thread and self.monitoring_thread.is_alive():
@@ -261,7 +439,7 @@ class EventMonitor:
             
             logger.info("Event monitor stopped successfully")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Error stopping event monitor: {e}")
             return False
@@ -281,7 +459,7 @@ class EventMonitor:
         
         Args:
             interval (float): New polling interval in seconds
-            
+        
         Returns:
             bool: True if interval was set successfully
         """
@@ -291,11 +469,11 @@ class EventMonitor:
         elif interval > 60.0:
             logger.warning("Polling interval too high, setting to 60 seconds")
             interval = 60.0
-            
+        
         with self.interval_lock:
             old_interval = self.polling_interval
             self.polling_interval = interval
-            
+        
         logger.info(f"Polling interval changed from {old_interval}s to {interval}s")
         return True
     
@@ -320,6 +498,12 @@ class EventMonitor:
             'running': self.running,
             'thread_alive': self.monitoring_thread.is_alive() if self.monitoring_thread else False,
             'thread_id': self.thread_id,
-            'hook_handle': self.hook_handle,
-            'polling_interval': self.get_polling_interval()
+            'hook_handles': list(self.hook_handles),
+            'polling_interval': self.get_polling_interval(),
+            'current_interval': self.current_interval,
+            'poll_count': self.poll_count,
+            'idle_polls': self.idle_polls,
+            'avg_enum_ms': round(self.avg_enum_ms, 3),
+            'window_cache': get_cache_stats(),
+            'window_info_cache': cache.window_info_cache.get_stats()
         } 
\ No newline at end of file
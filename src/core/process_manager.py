@@ -1,46 +1,114 @@
+import threading
+import time
 import psutil
 import win32api
 import win32con
 import win32process
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from ..utils.logger import get_logger
+from ..utils.nt_process import snapshot_processes
 
 logger = get_logger(__name__)
 
+# psutil.Process handles reused across calls, so repeated queries skip
+# re-opening the process and cpu_percent() has a baseline to measure from
+_process_cache: Dict[int, psutil.Process] = {}
+_PROCESS_CACHE_SIZE = 256
+
+# Process table snapshot (PID -> name) and lower-cased name -> PIDs index,
+# rebuilt at most once per _NAME_INDEX_TTL seconds
+_pid_names: Dict[int, str] = {}
+_name_index: Dict[str, List[int]] = {}
+_name_index_time = 0.0
+_name_index_lock = threading.Lock()
+_NAME_INDEX_TTL = 0.5
+# Lookups served from the current snapshot (hits) or that rebuilt it (misses)
+_snapshot_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
 
 class ProcessManager:
     """Manager class for process operations"""
     
     def __init__(self):
         self.logger = logger
+        # Bind the module functions directly so calls skip a wrapper frame
+        self.get_process_name = get_process_name
+        self.is_process_running = is_process_running
+        self.terminate_process = terminate_process
+        self.get_process_children = get_process_children
+        self.get_process_info = get_process_info
+        self.find_processes_by_name = find_processes_by_name
+        self.is_process_elevated = is_process_elevated
+        self.are_processes_running = are_processes_running
+        self.get_process_names = get_process_names
+        self.get_snapshot_stats = get_snapshot_stats
+
+
+def _get_process(pid: int) -> psutil.Process:
+    """
+    Get a cached psutil.Process for a PID, replacing it if the process exited
+    or the PID was reused.
     
-    def get_process_name(self, pid: int) -> Optional[str]:
-        """Get the process name using psutil for robustness."""
-        return get_process_name(pid)
-    
-    def is_process_running(self, pid: int) -> bool:
-        """Check if a process exists and is running."""
-        return is_process_running(pid)
+    Args:
+        pid (int): Process ID
+        
+    Returns:
+        psutil.Process: Process handle
+        
+    Raises:
+        psutil.NoSuchProcess: If no process with this PID exists
+    """
+    process = _process_cache.get(pid)
+    if process is None or not process.is_running():
+        process = psutil.Process(pid)
+        if len(_process_cache) >= _PROCESS_CACHE_SIZE:
+            _process_cache.clear()
+        _process_cache[pid] = process
+    return process
+
+
+def _refresh_process_table() -> None:
+    """
+    Rebuild the PID -> name snapshot and name index if they are older than
+    _NAME_INDEX_TTL. Must be called with _name_index_lock held.
+    """
+    global _pid_names, _name_index, _name_index_time
     
-    def terminate_process(self, pid: int, force: bool = False) -> bool:
-        """Terminate a process gracefully or forcefully."""
-        return terminate_process(pid, force)
+    if time.monotonic() - _name_index_time < _NAME_INDEX_TTL:
+        _snapshot_stats["hits"] += 1
+        return
     
-    def get_process_children(self, pid: int) -> List[int]:
-        """Get all child process IDs for a given process."""
-        return get_process_children(pid)
+    _snapshot_stats["misses"] += 1
+    # One NtQuerySystemInformation call covers every process; psutil is the fallback
+    pid_names = snapshot_processes()
+    if pid_names is None:
+        pid_names = {}
+        # Only prefetch the name; the pid is already known to process_iter
+        for proc in psutil.process_iter(['name']):
+            try:
+                name = proc.info['name']
+                if name:
+                    pid_names[proc.pid] = name
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
     
-    def get_process_info(self, pid: int) -> Optional[dict]:
-        """Get comprehensive information about a process."""
-        return get_process_info(pid)
+    name_index = {}
+    for pid, name in pid_names.items():
+        name_index.setdefault(name.lower(), []).append(pid)
     
-    def find_processes_by_name(self, process_name: str) -> List[int]:
-        """Find all running processes with a specific name."""
-        return find_processes_by_name(process_name)
+    _pid_names = pid_names
+    _name_index = name_index
+    _name_index_time = time.monotonic()
+
+
+def get_snapshot_stats() -> Dict[str, int]:
+    """
+    Get hit and miss counts for the process table snapshot.
     
-    def is_process_elevated(self, pid: int) -> bool:
-        """Check if a process is running with elevated privileges."""
-        return is_process_elevated(pid)
+    Returns:
+        Dict[str, int]: Counters plus the number of processes in the snapshot
+    """
+    return {**_snapshot_stats, "size": len(_pid_names)}
 
 
 def get_process_name(pid: int) -> Optional[str]:
@@ -54,7 +122,7 @@ def get_process_name(pid: int) -> Optional[str]:
         str: Process name (e.g., "notepad.exe") or None if failed
     """
     try:
-        process = psutil.Process(pid)
+        process = _get_process(pid)
         return process.name()
     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
         logger.warning(f"Failed to get process name for PID {pid}: {e}")
@@ -72,7 +140,7 @@ def is_process_running(pid: int) -> bool:
         bool: True if process is running
     """
     try:
-        process = psutil.Process(pid)
+        process = _get_process(pid)
         return process.is_running()
     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
         return False
@@ -90,7 +158,7 @@ def terminate_process(pid: int, force: bool = False) -> bool:
         bool: True if process was terminated successfully
     """
     try:
-        process = psutil.Process(pid)
+        process = _get_process(pid)
         
         if force:
             # Force kill
@@ -119,7 +187,7 @@ def get_process_children(pid: int) -> List[int]:
         List[int]: List of child process IDs
     """
     try:
-        process = psutil.Process(pid)
+        process = _get_process(pid)
         children = process.children(recursive=True)
         return [child.pid for child in children]
     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
@@ -138,19 +206,21 @@ def get_process_info(pid: int) -> Optional[dict]:
         dict: Process information or None if failed
     """
     try:
-        process = psutil.Process(pid)
-        return {
-            'pid': pid,
-            'name': process.name(),
-            'exe': process.exe(),
-            'cmdline': process.cmdline(),
-            'status': process.status(),
-            'create_time': process.create_time(),
-            'cpu_percent': process.cpu_percent(),
-            'memory_percent': process.memory_percent(),
-            'num_threads': process.num_threads(),
-            'username': process.username()
-        }
+        process = _get_process(pid)
+        # Fetch all attributes from a single cached kernel query
+        with process.oneshot():
+            return {
+                'pid': pid,
+                'name': process.name(),
+                'exe': process.exe(),
+                'cmdline': process.cmdline(),
+                'status': process.status(),
+                'create_time': process.create_time(),
+                'cpu_percent': process.cpu_percent(),
+                'memory_percent': process.memory_percent(),
+                'num_threads': process.num_threads(),
+                'username': process.username()
+            }
     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
         logger.warning(f"Failed to get process info for PID {pid}: {e}")
         return None
@@ -166,18 +236,14 @@ def find_processes_by_name(process_name: str) -> List[int]:
     Returns:
         List[int]: List of process IDs
     """
-    pids = []
     try:
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                if proc.info['name'].lower() == process_name.lower():
-                    pids.append(proc.info['pid'])
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
+        with _name_index_lock:
+            # Lookups in quick succession share one process table snapshot
+            _refresh_process_table()
+            return list(_name_index.get(process_name.lower(), []))
     except Exception as e:
         logger.error(f"Error searching for processes by name {process_name}: {e}")
-        
-    return pids
+        return []
 
 
 def is_process_elevated(pid: int) -> bool:
@@ -191,8 +257,54 @@ def is_process_elevated(pid: int) -> bool:
         bool: True if process is elevated
     """
     try:
-        process = psutil.Process(pid)
+        process = _get_process(pid)
         return process.uids().real == 0  # On Windows, this checks for admin privileges
     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
         logger.warning(f"Failed to check elevation for process {pid}: {e}")
-        return False 
\ No newline at end of file
+        return False
+
+
+def are_processes_running(pids: Iterable[int]) -> Dict[int, bool]:
+    """
+    Check which of several processes are running using one PID snapshot.
+    
+    Args:
+        pids (Iterable[int]): Process IDs
+        
+    Returns:
+        Dict[int, bool]: Mapping of each PID to whether it is running
+    """
+    pids = list(pids)
+    try:
+        running_pids = set(psutil.pids())
+    except Exception as e:
+        logger.error(f"Error listing running processes: {e}")
+        return dict.fromkeys(pids, False)
+    
+    return {pid: pid in running_pids for pid in pids}
+
+
+def get_process_names(pids: Iterable[int]) -> Dict[int, Optional[str]]:
+    """
+    Get the names of several processes from one process table snapshot.
+    
+    Args:
+        pids (Iterable[int]): Process IDs
+        
+    Returns:
+        Dict[int, Optional[str]]: Mapping of each PID to its name, or None if
+        the process is gone or inaccessible
+    """
+    names = dict.fromkeys(pids)
+    try:
+        with _name_index_lock:
+            _refresh_process_table()
+            pid_names = _pid_names
+    except Exception as e:
+        logger.error(f"Error listing running processes: {e}")
+        return names
+    
+    for pid in names:
+        names[pid] = pid_names.get(pid)
+    
+    return names 
\ No newline at end of file
@@ -1,82 +1,85 @@
+import logging
+import threading
 import win32gui
 import win32con
 import win32api
 import win32process
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Per-window data that never changes while a window exists, keyed by hwnd;
+# entries are dropped by invalidate_window() when the window is destroyed.
+# (Top-level state isn't cached: SetParent can change it during a window's life.)
+_class_cache: Dict[int, str] = {}
+_pid_cache: Dict[int, int] = {}
+_WINDOW_CACHE_SIZE = 4096
+# Lookups answered from (hits) or added to (misses) the caches above
+_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+# The caches are shared by the event, rule and thread-pool threads. Writes, evictions
+# and the miss/eviction counters are serialized; lookups are single dict reads and
+# stay lock-free, so the hit counter is approximate
+_cache_lock = threading.Lock()
+
 
 class WindowManager:
     """Manager class for window operations"""
     
     def __init__(self):
         self.logger = logger
+        # Bind the module functions directly so calls skip a wrapper frame
+        self.minimize_window = minimize_window
+        self.maximize_window = maximize_window
+        self.restore_window = restore_window
+        self.close_window = close_window
+        self.bring_to_foreground = bring_to_foreground
+        self.is_window_visible = is_window_visible
+        self.get_window_state = get_window_state
+        self.get_window_title = get_window_title
+        self.get_window_class = get_window_class
+        self.get_window_process_id = get_window_process_id
+        self.get_window_rect = get_window_rect
+        self.set_window_pos = set_window_pos
+        self.is_window_top_level = is_window_top_level
+        self.hide_window = hide_window
+        self.show_window = show_window
+        self.flash_window = flash_window
+        self.invalidate_window = invalidate_window
+        self.get_cache_stats = get_cache_stats
+
+
+def _cache_window_value(cache: dict, hwnd: int, value) -> None:
+    """Store a per-window value, evicting the oldest entry when the cache is full."""
+    with _cache_lock:
+        _cache_stats["misses"] += 1
+        if len(cache) >= _WINDOW_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)
+            _cache_stats["evictions"] += 1
+        cache[hwnd] = value
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """
+    Get hit, miss and eviction counts for the per-window caches.
     
-    def minimize_window(self, hwnd: int) -> bool:
-        """Minimize a window."""
-        return minimize_window(hwnd)
-    
-    def maximize_window(self, hwnd: int) -> bool:
-        """Maximize a window."""
-        return maximize_window(hwnd)
-    
-    def restore_window(self, hwnd: int) -> bool:
-        """Restore a window from minimized or maximized state."""
-        return restore_window(hwnd)
-    
-    def close_window(self, hwnd: int) -> bool:
-        """Send WM_CLOSE message to request a window to close gracefully."""
-        return close_window(hwnd)
-    
-    def bring_to_foreground(self, hwnd: int) -> bool:
-        """Bring a window to the foreground and activate it."""
-        return bring_to_foreground(hwnd)
-    
-    def is_window_visible(self, hwnd: int) -> bool:
-        """Check if a window is visible."""
-        return is_window_visible(hwnd)
-    
-    def get_window_state(self, hwnd: int) -> int:
-        """Get the current state of a window."""
-        return get_window_state(hwnd)
-    
-    def get_window_title(self, hwnd: int) -> str:
-        """Get the title of a window."""
-        return get_window_title(hwnd)
-    
-    def get_window_class(self, hwnd: int) -> str:
-        """Get the class name of a window."""
-        return get_window_class(hwnd)
-    
-    def get_window_process_id(self, hwnd: int) -> Optional[int]:
-        """Get the process ID of a window."""
-        return get_window_process_id(hwnd)
-    
-    def get_window_rect(self, hwnd: int) -> Optional[Tuple[int, int, int, int]]:
-        """Get the position and size of a window."""
-        return get_window_rect(hwnd)
-    
-    def set_window_pos(self, hwnd: int, x: int, y: int, width: int, height: int, flags: int = 0) -> bool:
-        """Set the position and size of a window."""
-        return set_window_pos(hwnd, x, y, width, height, flags)
-    
-    def is_window_top_level(self, hwnd: int) -> bool:
-        """Check if a window is a top-level window."""
-        return is_window_top_level(hwnd)
-    
-    def hide_window(self, hwnd: int) -> bool:
-        """Hide a window."""
-        return hide_window(hwnd)
-    
-    def show_window(self, hwnd: int) -> bool:
-        """Show a window."""
-        return show_window(hwnd)
+    Returns:
+        Dict[str, int]: Counters plus the number of cached windows
+    """
+    with _cache_lock:
+        return {**_cache_stats, "size": len(_class_cache)}
+
+
+def invalidate_window(hwnd: int) -> None:
+    """
+    Forget cached class and process ID for a window.
     
-    def flash_window(self, hwnd: int, count: int = 3) -> bool:
-        """Flash a window to draw attention."""
-        return flash_window(hwnd, count)
+    Args:
+        hwnd (int): Window handle of a destroyed window
+    """
+    with _cache_lock:
+        _class_cache.pop(hwnd, None)
+        _pid_cache.pop(hwnd, None)
 
 
 def minimize_window(hwnd: int) -> bool:
@@ -91,7 +94,7 @@ def minimize_window(hwnd: int) -> bool:
     """
     try:
         result = win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
-        if result:
+        if result and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Minimized window {hwnd}")
         return result
     except Exception as e:
@@ -111,7 +114,7 @@ def maximize_window(hwnd: int) -> bool:
     """
     try:
         result = win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
-        if result:
+        if result and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Maximized window {hwnd}")
         return result
     except Exception as e:
@@ -131,7 +134,7 @@ def restore_window(hwnd: int) -> bool:
     """
     try:
         result = win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-        if result:
+        if result and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Restored window {hwnd}")
         return result
     except Exception as e:
@@ -151,7 +154,7 @@ def close_window(hwnd: int) -> bool:
     """
     try:
         result = win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
-        if result:
+        if result and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Sent close message to window {hwnd}")
         return result
     except Exception as e:
@@ -170,18 +173,18 @@ def bring_to_foreground(hwnd: int) -> bool:
         bool: True if successful
     """
     try:
-        # First, restore the window if it's minimized
-        placement = win32gui.GetWindowPlacement(hwnd)
-        if placement[1] == win32con.SW_SHOWMINIMIZED:
+        # First, restore the window if it's minimized (in any minimized show state)
+        if win32gui.IsIconic(hwnd):
             win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
             
-        # Bring to foreground
-        result = win32gui.SetForegroundWindow(hwnd)
-        if result:
+        # Bring to foreground; pywin32 raises on failure and returns None on success
+        win32gui.SetForegroundWindow(hwnd)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Brought window {hwnd} to foreground")
-        return result
+        return True
     except Exception as e:
-        logger.error(f"Failed to bring window {hwnd} to foreground: {e}")
+        # Windows routinely refuses focus changes (foreground lock), so this isn't an error
+        logger.warning(f"Failed to bring window {hwnd} to foreground: {e}")
         return False
 
 
@@ -247,8 +250,15 @@ def get_window_class(hwnd: int) -> str:
     Returns:
         str: Window class name
     """
+    class_name = _class_cache.get(hwnd)
+    if class_name is not None:
+        _cache_stats["hits"] += 1
+        return class_name
+    
     try:
-        return win32gui.GetClassName(hwnd)
+        class_name = win32gui.GetClassName(hwnd)
+        _cache_window_value(_class_cache, hwnd, class_name)
+        return class_name
     except Exception as e:
         logger.warning(f"Failed to get class for window {hwnd}: {e}")
         return ""
@@ -264,8 +274,15 @@ def get_window_process_id(hwnd: int) -> Optional[int]:
     Returns:
         int: Process ID or None if failed
     """
+    pid = _pid_cache.get(hwnd)
+    if pid is not None:
+        _cache_stats["hits"] += 1
+        return pid
+    
     try:
-        return win32process.GetWindowThreadProcessId(hwnd)[1]
+        pid = win32process.GetWindowThreadProcessId(hwnd)[1]
+        _cache_window_value(_pid_cache, hwnd, pid)
+        return pid
     except Exception as e:
         logger.warning(f"Failed to get PID for window {hwnd}: {e}")
         return None
@@ -305,7 +322,7 @@ def set_window_pos(hwnd: int, x: int, y: int, width: int, height: int, flags: in
     """
     try:
         result = win32gui.SetWindowPos(hwnd, 0, x, y, width, height, flags)
-        if result:
+        if result and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Set position for window {hwnd} to ({x}, {y}, {width}, {height})")
         return result
     except Exception as e:
@@ -342,7 +359,7 @@ def hide_window(hwnd: int) -> bool:
     """
     try:
         result = win32gui.ShowWindow(hwnd, win32con.SW_HIDE)
-        if result:
+        if result and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Hidden window {hwnd}")
         return result
     except Exception as e:
@@ -362,7 +379,7 @@ def show_window(hwnd: int) -> bool:
     """
     try:
         result = win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
-        if result:
+        if result and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Shown window {hwnd}")
         return result
     except Exception as e:
@@ -383,7 +400,7 @@ def flash_window(hwnd: int, count: int = 3) -> bool:
     """
     try:
         result = win32gui.FlashWindow(hwnd, True)
-        if result:
+        if result and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Flashed window {hwnd} {count} times")
         return result
     except Exception as e:
@@ -1,44 +1,214 @@
-import os
-from typing import List, Dict, Any, Optional
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, Tuple
+import win32con
+import win32gui
 from ..core.window_manager import (
-    minimize_window, close_window, bring_to_foreground,
+    bring_to_foreground, hide_window,
     is_window_visible, is_window_top_level
 )
-from ..utils.win32_helpers import get_explorer_folder_path, get_window_process_name, enum_explorer_windows_with_paths
+from ..utils.win32_helpers import (
+    get_explorer_folder_path, get_window_process_name, enum_explorer_windows_with_paths, get_path_key
+)
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Explorer windows grouped by folder path key, reused by events in quick succession
+_explorer_cache: Dict[str, Any] = {'time': 0.0, 'groups': None}
+_EXPLORER_CACHE_TTL = 0.25
+
+# Seconds to wait for more events of the same burst before running a batched action
+DEBOUNCE_DELAY = 0.05
+
+# ShowWindow blocks until the target window's thread handles it, so per-window
+# calls are issued concurrently; a hung window then only delays itself
+_ACTION_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="win-action")
+_ACTION_TIMEOUT = 2.0
+
+
+@lru_cache(maxsize=4096)
+def _exe_basename_lower(exe_path: str) -> str:
+    """Get the lower-cased file name of an executable path, cached per path."""
+    # Interned, so equal names from different paths are one object and compare by identity first
+    return sys.intern(exe_path.rpartition('\\')[2].rpartition('/')[2].lower())
+
+
+def _group_explorer_by_path(explorer_windows: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group explorer windows by normalized folder path.
+    
+    Args:
+        explorer_windows: List of { 'hwnd', 'path', 'path_key' } dictionaries
+        
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Windows for each path key
+    """
+    groups = {}
+    for win in explorer_windows:
+        groups.setdefault(win['path_key'], []).append(win)
+    return groups
+
+
+def _get_explorer_groups(hwnd: Optional[int] = None,
+                         path_key: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Get open explorer windows grouped by folder path, re-enumerating and
+    regrouping at most once per _EXPLORER_CACHE_TTL seconds.
+    
+    Args:
+        hwnd: Explorer window the caller just looked at; the cache is refreshed
+            if it doesn't list this window (opened since the last enumeration)
+        path_key: Path key just read for hwnd; the cache is refreshed if it
+            lists hwnd under a different path (navigated since)
+    
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: { 'hwnd', 'path', 'path_key' } dictionaries for each path key
+    """
+    now = time.monotonic()
+    groups = _explorer_cache['groups']
+    stale = (groups is None or now - _explorer_cache['time'] >= _EXPLORER_CACHE_TTL or
+             (hwnd is not None and
+              not any(win['hwnd'] == hwnd for win in groups.get(path_key, ()))))
+    if stale:
+        _explorer_cache['groups'] = _group_explorer_by_path(enum_explorer_windows_with_paths())
+        _explorer_cache['time'] = now
+    return _explorer_cache['groups']
+
+
+def invalidate_explorer_cache() -> None:
+    """Forget the cached explorer window enumeration, e.g. after a window closes."""
+    _explorer_cache['groups'] = None
+
+
+def _batch_post(target_windows: List[Dict[str, Any]], msg: int, wparam: int = 0) -> List[Dict[str, Any]]:
+    """
+    Post a message to each window without waiting for any of them to handle it.
+    
+    Args:
+        target_windows: List of window info dictionaries
+        msg: Window message to post
+        wparam: Message WPARAM
+        
+    Returns:
+        List[Dict[str, Any]]: The windows the message was posted to
+    """
+    posted = []
+    for window_info in target_windows:
+        hwnd = window_info.get('hwnd')
+        try:
+            # PostMessage only queues the message; pywin32 raises if that fails
+            win32gui.PostMessage(hwnd, msg, wparam, 0)
+            posted.append(window_info)
+        except Exception as e:
+            logger.warning("Failed to post message %#x to window %s: %s", msg, hwnd, e)
+    return posted
+
+
+class _PendingBatcher:
+    """
+    Coalesces calls to an action handler that arrive within a debounce window,
+    so a burst of events runs the handler once per key with the union of
+    their target windows and the most recent triggering window.
+    """
+    
+    def __init__(self, handler: Callable[[List[Dict[str, Any]], Optional[Dict[str, Any]]], bool],
+                 key_func: Callable[[Optional[Dict[str, Any]]], Any],
+                 delay: float = DEBOUNCE_DELAY):
+        self.handler = handler
+        # Batch key for a triggering window, or None if the call can't be batched
+        self.key_func = key_func
+        self.delay = delay
+        self.lock = threading.Lock()
+        # key -> (hwnd -> target window info, latest triggering window info, completion callbacks)
+        self.pending: Dict[Any, Tuple[Dict[int, Dict[str, Any]], Optional[Dict[str, Any]],
+                                      List[Callable[[bool], None]]]] = {}
+        self.timer: Optional[threading.Timer] = None
+    
+    def submit(self, key: Any, target_windows: List[Dict[str, Any]],
+               new_window_info: Optional[Dict[str, Any]],
+               on_complete: Optional[Callable[[bool], None]] = None) -> None:
+        """
+        Queue a call, merging it with pending calls for the same key.
+        
+        Args:
+            key: Batch key from key_func
+            target_windows: List of window info dictionaries
+            new_window_info: Information about the triggering window
+            on_complete: Called with the handler's result once the batch has run
+        """
+        with self.lock:
+            targets, _, callbacks = self.pending.get(key, ({}, None, []))
+            for window_info in target_windows:
+                targets[window_info.get('hwnd')] = window_info
+            if on_complete is not None:
+                callbacks.append(on_complete)
+            self.pending[key] = (targets, new_window_info, callbacks)
+            
+            if self.timer is None:
+                self.timer = threading.Timer(self.delay, self._flush)
+                self.timer.daemon = True
+                self.timer.start()
+    
+    def _flush(self) -> None:
+        """Run the handler once for every pending key."""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.timer = None
+        
+        for targets, new_window_info, callbacks in pending.values():
+            try:
+                result = bool(self.handler(list(targets.values()), new_window_info))
+            except Exception as e:
+                logger.error(f"Error running batched action: {e}")
+                result = False
+            
+            # Every call merged into this batch is reported with the batch's result
+            for on_complete in callbacks:
+                try:
+                    on_complete(result)
+                except Exception as e:
+                    logger.error(f"Error reporting batched action result: {e}")
+
 
 def perform_action(action_type: str, target_windows: List[Dict[str, Any]], 
-                  new_window_info: Optional[Dict[str, Any]] = None) -> bool:
+                  new_window_info: Optional[Dict[str, Any]] = None,
+                  on_complete: Optional[Callable[[bool], None]] = None) -> Optional[bool]:
     """
     Central function that dispatches to specific helper functions based on action_type.
+    MINIMIZE_OTHERS_OF_SAME_APP is debounced: windows of one application opening
+    in a burst are handled together once the burst settles.
     
     Args:
         action_type: Type of action to perform
         target_windows: List of window info dictionaries to act upon
         new_window_info: Information about the triggering window (optional)
+        on_complete: For debounced actions, called with the result once the
+            queued batch has run (optional)
         
     Returns:
-        bool: True if action was performed successfully
+        Optional[bool]: True if action was performed successfully, or None if it
+        was queued and its result will be passed to on_complete
     """
     try:
         logger.info(f"Performing action: {action_type} on {len(target_windows)} windows")
         
-        if action_type == "MINIMIZE_OTHERS_OF_SAME_APP":
-            return _minimize_others_of_same_app(target_windows, new_window_info)
-        elif action_type == "CLOSE_DUPLICATE_PATH":
-            return _close_duplicate_path(target_windows, new_window_info)
-        elif action_type == "BRING_TO_FOREGROUND":
-            return _bring_to_foreground(target_windows)
-        elif action_type == "CLOSE_WINDOW":
-            return _close_windows(target_windows)
-        elif action_type == "HIDE_WINDOW":
-            return _hide_windows(target_windows)
-        else:
+        handler = _DISPATCH.get(action_type)
+        if handler is None:
             logger.warning(f"Unknown action type: {action_type}")
             return False
+        
+        batcher = _BATCHERS.get(action_type)
+        if batcher is not None:
+            key = batcher.key_func(new_window_info)
+            if key is not None:
+                batcher.submit(key, target_windows, new_window_info, on_complete)
+                return None
+        return handler(target_windows, new_window_info)
             
     except Exception as e:
         logger.error(f"Error performing action {action_type}: {e}")
@@ -70,30 +240,23 @@ def _minimize_others_of_same_app(target_windows: List[Dict[str, Any]],
             return False
             
         # Extract executable name from path
-        new_exe_name = os.path.basename(new_window_exe).lower()
+        new_exe_name = _exe_basename_lower(new_window_exe)
         
-        minimized_count = 0
-        for window_info in target_windows:
-            hwnd = window_info.get('hwnd')
-            
-            # Skip the triggering window
-            if hwnd == new_window_hwnd:
-                continue
-                
-            # Check if it's the same application
-            window_exe = window_info.get('exe_path', '')
-            if window_exe:
-                window_exe_name = os.path.basename(window_exe).lower()
-                if window_exe_name == new_exe_name:
-                    # Check if window is visible and top-level
-                    if (window_info.get('is_visible', False) and 
-                        window_info.get('is_top_level', False)):
-                        
-                        if minimize_window(hwnd):
-                            minimized_count += 1
-                            logger.info(f"Minimized window: {window_info.get('title', 'Unknown')} (HWND: {hwnd})")
-                        else:
-                            logger.warning(f"Failed to minimize window {hwnd}")
+        # Select visible, top-level windows of the same application (other than the
+        # triggering window) in one filter pass, cheapest checks first
+        candidates = [window_info for window_info in target_windows
+                      if window_info.get('is_visible', False)
+                      and window_info.get('is_top_level', False)
+                      and window_info.get('hwnd') != new_window_hwnd
+                      and _exe_basename_lower(window_info.get('exe_path') or '') == new_exe_name]
+        
+        # Post all minimize requests in one burst instead of waiting on each window
+        minimized = _batch_post(candidates, win32con.WM_SYSCOMMAND, win32con.SC_MINIMIZE)
+        # Per-window lines are debug detail; the summary below is the info-level record
+        if logger.isEnabledFor(logging.DEBUG):
+            for window_info in minimized:
+                logger.debug("Minimized window: %s (HWND: %s)", window_info.get('title', 'Unknown'), window_info.get('hwnd'))
+        minimized_count = len(minimized)
         
         logger.info(f"Minimized {minimized_count} windows of {new_exe_name}")
         return minimized_count > 0
@@ -103,6 +266,21 @@ def _minimize_others_of_same_app(target_windows: List[Dict[str, Any]],
         return False
 
 
+def _app_key(new_window_info: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Batch MINIMIZE_OTHERS_OF_SAME_APP per application.
+    
+    Args:
+        new_window_info: Information about the new window that triggered the action
+        
+    Returns:
+        Optional[str]: Lower-cased executable name, or None to run the handler
+        right away so it reports the missing information
+    """
+    new_window_exe = (new_window_info or {}).get('exe_path', '')
+    return _exe_basename_lower(new_window_exe) if new_window_exe else None
+
+
 def _close_duplicate_path(target_windows: List[Dict[str, Any]], 
                          new_window_info: Optional[Dict[str, Any]] = None) -> bool:
     """
@@ -123,33 +301,28 @@ def _close_duplicate_path(target_windows: List[Dict[str, Any]],
             logger.warning("Could not determine folder path for new explorer window")
             return False
         logger.info(f"New explorer window opened to: {new_window_path}")
-        explorer_windows = enum_explorer_windows_with_paths()
-        # Find all windows with the same path (including the new one)
-        duplicates = [win for win in explorer_windows if win['path'].lower() == new_window_path.lower()]
+        new_path_key = get_path_key(new_window_path)
+        # Find all windows with the same path (including the new one); bursts of
+        # explorer windows opening share one COM enumeration and its grouping
+        duplicates = _get_explorer_groups(new_window_hwnd, new_path_key).get(new_path_key, [])
         if len(duplicates) <= 1:
             logger.info("No duplicates found for this folder window.")
             return False
         # Try to identify the new window (foreground or highest Z-order)
-        import win32gui
         foreground_hwnd = win32gui.GetForegroundWindow()
         # Prefer to keep the new window (by hwnd), or the foreground window if not sure
-        keep_hwnd = new_window_hwnd if new_window_hwnd in [d['hwnd'] for d in duplicates] else foreground_hwnd
-        closed_count = 0
-        for win in duplicates:
-            hwnd = win['hwnd']
-            if hwnd == keep_hwnd:
-                continue  # Don't close the new/foreground window
-            if close_window(hwnd):
-                closed_count += 1
-                logger.info(f"Closed duplicate explorer window: {win['path']} (HWND: {hwnd})")
-            else:
-                logger.warning(f"Failed to close duplicate window {hwnd}")
-        # Optionally, bring the kept window to the foreground
-        try:
-            from ..core.window_manager import bring_to_foreground
-            bring_to_foreground(keep_hwnd)
-        except Exception:
-            pass
+        keep_hwnd = new_window_hwnd if any(d['hwnd'] == new_window_hwnd for d in duplicates) else foreground_hwnd
+        # Don't close the new/foreground window
+        closed = _batch_post([win for win in duplicates if win['hwnd'] != keep_hwnd], win32con.WM_CLOSE)
+        if logger.isEnabledFor(logging.DEBUG):
+            for win in closed:
+                logger.debug("Closed duplicate explorer window: %s (HWND: %s)", win['path'], win['hwnd'])
+        closed_count = len(closed)
+        if closed:
+            invalidate_explorer_cache()
+        # Optionally, bring the kept window to the foreground; a refusal is logged as a
+        # warning by the callee and doesn't affect the result
+        bring_to_foreground(keep_hwnd)
         logger.info(f"Closed {closed_count} duplicate explorer windows (kept HWND: {keep_hwnd})")
         return closed_count > 0
     except Exception as e:
@@ -174,9 +347,9 @@ def _bring_to_foreground(target_windows: List[Dict[str, Any]]) -> bool:
             
             if bring_to_foreground(hwnd):
                 success_count += 1
-                logger.info(f"Brought to foreground: {window_info.get('title', 'Unknown')} (HWND: {hwnd})")
+                logger.debug("Brought to foreground: %s (HWND: %s)", window_info.get('title', 'Unknown'), hwnd)
             else:
-                logger.warning(f"Failed to bring window {hwnd} to foreground")
+                logger.warning("Failed to bring window %s to foreground", hwnd)
         
         logger.info(f"Brought {success_count} windows to foreground")
         return success_count > 0
@@ -197,15 +370,12 @@ def _close_windows(target_windows: List[Dict[str, Any]]) -> bool:
         bool: True if action was performed successfully
     """
     try:
-        closed_count = 0
-        for window_info in target_windows:
-            hwnd = window_info.get('hwnd')
-            
-            if close_window(hwnd):
-                closed_count += 1
-                logger.info(f"Closed window: {window_info.get('title', 'Unknown')} (HWND: {hwnd})")
-            else:
-                logger.warning(f"Failed to close window {hwnd}")
+        # WM_CLOSE is posted to every window before any of them handles it
+        closed = _batch_post(target_windows, win32con.WM_CLOSE)
+        if logger.isEnabledFor(logging.DEBUG):
+            for window_info in closed:
+                logger.debug("Closed window: %s (HWND: %s)", window_info.get('title', 'Unknown'), window_info.get('hwnd'))
+        closed_count = len(closed)
         
         logger.info(f"Closed {closed_count} windows")
         return closed_count > 0
@@ -226,17 +396,30 @@ def _hide_windows(target_windows: List[Dict[str, Any]]) -> bool:
         bool: True if action was performed successfully
     """
     try:
-        from ..core.window_manager import hide_window
+        futures = [(window_info, _ACTION_POOL.submit(hide_window, window_info.get('hwnd')))
+                   for window_info in target_windows]
+        # One deadline for the whole batch, however many windows are hung
+        wait([future for _, future in futures], timeout=_ACTION_TIMEOUT)
         
         hidden_count = 0
-        for window_info in target_windows:
+        for window_info, future in futures:
             hwnd = window_info.get('hwnd')
+            if not future.done():
+                # Calls still queued behind hung ones are dropped rather than run late
+                future.cancel()
+                logger.warning("Timed out hiding window %s", hwnd)
+                continue
+            try:
+                hidden = future.result()
+            except Exception as e:
+                logger.warning("Failed hiding window %s: %s", hwnd, e)
+                continue
             
-            if hide_window(hwnd):
+            if hidden:
                 hidden_count += 1
-                logger.info(f"Hidden window: {window_info.get('title', 'Unknown')} (HWND: {hwnd})")
+                logger.debug("Hidden window: %s (HWND: %s)", window_info.get('title', 'Unknown'), hwnd)
             else:
-                logger.warning(f"Failed to hide window {hwnd}")
+                logger.warning("Failed to hide window %s", hwnd)
         
         logger.info(f"Hidden {hidden_count} windows")
         return hidden_count > 0
@@ -246,6 +429,22 @@ def _hide_windows(target_windows: List[Dict[str, Any]]) -> bool:
         return False
 
 
+# Action type -> handler(target_windows, new_window_info)
+_DISPATCH: Dict[str, Callable[[List[Dict[str, Any]], Optional[Dict[str, Any]]], bool]] = {
+    "MINIMIZE_OTHERS_OF_SAME_APP": _minimize_others_of_same_app,
+    "CLOSE_DUPLICATE_PATH": _close_duplicate_path,
+    "BRING_TO_FOREGROUND": lambda target_windows, new_window_info: _bring_to_foreground(target_windows),
+    "CLOSE_WINDOW": lambda target_windows, new_window_info: _close_windows(target_windows),
+    "HIDE_WINDOW": lambda target_windows, new_window_info: _hide_windows(target_windows)
+}
+
+
+# Debounced action types -> batcher queuing their calls
+_BATCHERS: Dict[str, _PendingBatcher] = {
+    "MINIMIZE_OTHERS_OF_SAME_APP": _PendingBatcher(_minimize_others_of_same_app, _app_key)
+}
+
+
 def get_supported_actions() -> List[str]:
     """
     Get a list of supported action types.
@@ -253,10 +452,4 @@ def get_supported_actions() -> List[str]:
     Returns:
         List[str]: List of supported action types
     """
-    return [
-        "MINIMIZE_OTHERS_OF_SAME_APP",
-        "CLOSE_DUPLICATE_PATH", 
-        "BRING_TO_FOREGROUND",
-        "CLOSE_WINDOW",
-        "HIDE_WINDOW"
-    ] 
\ No newline at end of file
+    return list(_DISPATCH) 
\ No newline at end of file
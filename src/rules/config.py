@@ -1,11 +1,39 @@
+import copy
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 from pathlib import Path
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Rule schema, checked by _validate_rule
+_REQUIRED_FIELDS = ('name', 'enabled', 'trigger', 'action')
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+_VALID_EVENT_TYPES = frozenset({'CREATE', 'DESTROY', 'SHOW', 'HIDE', 'FOREGROUND', 'NAMECHANGE'})
+_VALID_ACTION_TYPES = frozenset({
+    'MINIMIZE_OTHERS_OF_SAME_APP',
+    'CLOSE_DUPLICATE_PATH',
+    'BRING_TO_FOREGROUND',
+    'CLOSE_WINDOW',
+    'HIDE_WINDOW'
+})
+
+
+def _priority_key(rule: Dict[str, Any]) -> Any:
+    """Sort key for rules; a missing priority sorts as 0 without adding one to the rule."""
+    return rule.get('priority', 0)
+
+
+# Validated rules per file path, with the file's mtime when they were read
+_rules_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+
 
 class ConfigManager:
     """Manager class for configuration operations"""
@@ -15,18 +43,25 @@ class ConfigManager:
         self.config_dir.mkdir(exist_ok=True)
         self.rules_file = self.config_dir / "default_rules.json"
         self.logger = logger
+        self.rules = self.load_rules()  # Rules as of the last load
     
     def load_rules(self) -> List[Dict[str, Any]]:
         """Load rules from the configuration file"""
         try:
             if self.rules_file.exists():
-                return load_rules(str(self.rules_file))
+                self.rules = load_rules(str(self.rules_file))
             else:
                 # Return default rules if no config file exists
-                return get_default_rules()
+                self.rules = get_default_rules()
         except Exception as e:
             self.logger.error(f"Error loading rules: {e}")
-            return get_default_rules()
+            self.rules = get_default_rules()
+        return self.rules
+    
+    def reload(self) -> List[Dict[str, Any]]:
+        """Re-read the rules from disk, bypassing the parsed-rules cache"""
+        _rules_cache.pop(str(self.rules_file), None)
+        return self.load_rules()
     
     def save_rules(self, rules: List[Dict[str, Any]]) -> bool:
         """Save rules to the configuration file"""
@@ -43,7 +78,8 @@ class ConfigManager:
 
 def load_rules(filepath: str) -> List[Dict[str, Any]]:
     """
-    Load rules from a JSON file.
+    Load rules from a JSON file. Parsed rules are cached until the file's
+    modification time changes; each call returns its own copy.
     
     Args:
         filepath: Path to the JSON file containing rules
@@ -59,9 +95,19 @@ def load_rules(filepath: str) -> List[Dict[str, Any]]:
         if not os.path.exists(filepath):
             logger.error(f"Rules file not found: {filepath}")
             raise FileNotFoundError(f"Rules file not found: {filepath}")
+        
+        mtime_ns = os.stat(filepath).st_mtime_ns
+        cached = _rules_cache.get(filepath)
+        if cached and cached[0] == mtime_ns:
+            # Callers edit the rules they get back, so never hand out the cached list
+            return copy.deepcopy(cached[1])
             
-        with open(filepath, 'r', encoding='utf-8') as f:
-            rules = json.load(f)
+        if ORJSON_AVAILABLE:
+            # Parse the raw bytes directly, skipping the text decode layer
+            rules = orjson.loads(Path(filepath).read_bytes())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                rules = json.load(f)
             
         if not isinstance(rules, list):
             logger.error(f"Invalid rules file format: expected list, got {type(rules)}")
@@ -74,7 +120,8 @@ def load_rules(filepath: str) -> List[Dict[str, Any]]:
                 validated_rules.append(rule)
                 
         logger.info(f"Loaded {len(validated_rules)} rules from {filepath}")
-        return validated_rules
+        _rules_cache[filepath] = (mtime_ns, validated_rules)
+        return copy.deepcopy(validated_rules)
         
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in rules file {filepath}: {e}")
@@ -99,8 +146,27 @@ def save_rules(rules: List[Dict[str, Any]], filepath: str) -> bool:
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(rules, f, indent=4, ensure_ascii=False)
+        # The mtime may not change within the filesystem's timestamp resolution
+        _rules_cache.pop(filepath, None)
+        
+        # Always the stdlib encoder, so the file's format doesn't depend on whether orjson is installed
+        payload = json.dumps(rules, indent=4, ensure_ascii=False).encode('utf-8')
+        
+        # Write a temporary file and swap it in, so a crash never leaves a truncated config
+        temp_path = filepath + '.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            # Raises PermissionError on Windows while another process holds the file open
+            os.replace(temp_path, filepath)
+        except Exception:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
             
         logger.info(f"Saved {len(rules)} rules to {filepath}")
         return True
@@ -141,12 +207,11 @@ def _validate_rule(rule: Dict[str, Any], index: int) -> bool:
         bool: True if rule is valid
     """
     try:
-        # Check required fields
-        required_fields = ['name', 'enabled', 'trigger', 'action']
-        for field in required_fields:
-            if field not in rule:
-                logger.warning(f"Rule {index}: Missing required field '{field}'")
-                return False
+        # Check required fields in one set comparison; only look for which is missing on failure
+        if not rule.keys() >= _REQUIRED_FIELD_SET:
+            field = next(field for field in _REQUIRED_FIELDS if field not in rule)
+            logger.warning(f"Rule {index}: Missing required field '{field}'")
+            return False
                 
         # Validate trigger structure
         trigger = rule.get('trigger', {})
@@ -171,20 +236,12 @@ def _validate_rule(rule: Dict[str, Any], index: int) -> bool:
             return False
             
         # Validate event_type
-        valid_event_types = ['CREATE', 'DESTROY', 'SHOW', 'HIDE', 'FOREGROUND', 'NAMECHANGE']
-        if trigger['event_type'] not in valid_event_types:
+        if trigger['event_type'] not in _VALID_EVENT_TYPES:
             logger.warning(f"Rule {index}: Invalid event_type '{trigger['event_type']}'")
             return False
             
         # Validate action type
-        valid_action_types = [
-            'MINIMIZE_OTHERS_OF_SAME_APP',
-            'CLOSE_DUPLICATE_PATH',
-            'BRING_TO_FOREGROUND',
-            'CLOSE_WINDOW',
-            'HIDE_WINDOW'
-        ]
-        if action['type'] not in valid_action_types:
+        if action['type'] not in _VALID_ACTION_TYPES:
             logger.warning(f"Rule {index}: Invalid action type '{action['type']}'")
             return False
             
@@ -264,27 +321,28 @@ def disable_rule(rules: List[Dict[str, Any]], rule_name: str) -> bool:
     return False
 
 
-def get_enabled_rules(rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def get_enabled_rules(rules: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
     """
-    Get only the enabled rules from a list.
+    Iterate over only the enabled rules from a list.
     
     Args:
         rules: List of all rules
         
     Returns:
-        List[Dict[str, Any]]: List of enabled rules
+        Iterator[Dict[str, Any]]: Lazily filtered enabled rules; wrap in list()
+        if it must be indexed or traversed more than once
     """
-    return [rule for rule in rules if rule.get('enabled', False)]
+    return (rule for rule in rules if rule.get('enabled', False))
 
 
-def sort_rules_by_priority(rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def sort_rules_by_priority(rules: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Sort rules by priority (highest first).
     
     Args:
-        rules: List of rules to sort
+        rules: Rules to sort (any iterable, e.g. get_enabled_rules())
         
     Returns:
         List[Dict[str, Any]]: Sorted list of rules
     """
-    return sorted(rules, key=lambda x: x.get('priority', 0), reverse=True) 
\ No newline at end of file
+    return sorted(rules, key=_priority_key, reverse=True) 
\ No newline at end of file
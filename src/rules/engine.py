@@ -1,16 +1,25 @@
+import itertools
+import logging
+import queue
+import re
 import threading
 import time
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, FrozenSet
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import win32con
 from ..utils.logger import get_logger
 from ..utils.win32_helpers import enum_top_level_windows, get_window_info
-from .actions import perform_action
+from .actions import perform_action, invalidate_explorer_cache
 from .config import get_enabled_rules, sort_rules_by_priority
 
 logger = get_logger(__name__)
 
+# Queued by stop() behind any pending events to end the worker thread
+_STOP_WORKER = object()
+
 
 class RuleEngine:
     """
@@ -24,12 +33,6 @@ class RuleEngine:
         Args:
             rules_config: List of rule configurations
         """
-        self.rules_config = rules_config
-        self._internal_window_state: Dict[int, Dict[str, Any]] = {}
-        self._window_state_lock = threading.Lock()
-        self._event_count = 0
-        self._rule_execution_count = defaultdict(int)
-        
         # Event type mapping
         self.event_type_mapping = {
             win32con.EVENT_OBJECT_CREATE: "CREATE",
@@ -39,22 +42,159 @@ class RuleEngine:
             win32con.EVENT_SYSTEM_FOREGROUND: "FOREGROUND",
             win32con.EVENT_OBJECT_NAMECHANGE: "NAMECHANGE"
         }
+        # Reverse lookup used to index rules by the event ID their trigger names
+        self._event_ids = {name: event_id for event_id, name in self.event_type_mapping.items()}
+        
+        # Rule counters get their own small lock so stats never contend with window state.
+        # Execution counts are indexed by each prepared rule's '_idx' and rebuilt by reload_rules
+        self._stats_lock = threading.Lock()
+        self._sorted_enabled_rules: List[Dict[str, Any]] = []
+        self._rule_names: List[str] = []
+        self._rule_execution_counts: List[int] = []
+        self._rules_executed = 0  # Sum of _rule_execution_counts, kept for O(1) stats
+        
+        self._rules_lock = threading.Lock()
+        self.reload_rules(rules_config)
+        # Copy-on-write: writers publish a new dict under the lock, readers use
+        # whichever dict is current without locking and must not modify it
+        self._internal_window_state: Dict[int, Dict[str, Any]] = {}
+        # Secondary indices over the window state (lower-cased exe name / class -> hwnds),
+        # published copy-on-write together with it
+        self._by_exe: Dict[str, FrozenSet[int]] = {}
+        self._by_class: Dict[str, FrozenSet[int]] = {}
+        self._window_state_lock = threading.Lock()
+        # next() on itertools.count is atomic, so counting events needs no lock;
+        # _event_count holds the latest value for get_statistics
+        self._event_counter = itertools.count(1)
+        self._event_count = 0
+        self.status_log_interval = 50  # Log a status line every N events
+        self._pattern_cache: Dict[str, re.Pattern] = {}  # title_pattern -> compiled regex
+        
+        # Events are queued by the monitor's thread and evaluated on a worker,
+        # so slow rules or actions never hold up the WinEvent hook
+        self._event_queue: queue.Queue = queue.Queue(maxsize=1024)
+        self._dropped_events = 0
+        self.drop_warning_interval = 10.0  # Seconds between queue-full warnings
+        self._last_drop_warning = float('-inf')
+        self._stopped = False
+        
+        # Window state handlers keyed by raw event ID; other events leave state untouched
+        self._state_handlers = {
+            win32con.EVENT_OBJECT_CREATE: self._store_window,
+            win32con.EVENT_OBJECT_SHOW: self._store_window,
+            win32con.EVENT_OBJECT_DESTROY: self._remove_window,
+            win32con.EVENT_OBJECT_HIDE: self._remove_window,
+            win32con.EVENT_OBJECT_NAMECHANGE: self._refresh_window
+        }
         
         logger.info(f"RuleEngine initialized with {len(rules_config)} rules")
         
         # Initialize window state with currently open windows
         self._initialize_window_state()
+        
+        self._worker = threading.Thread(target=self._drain_events, daemon=True, name="RuleEngineWorker")
+        self._worker.start()
+    
+    def reload_rules(self, rules_config: List[Dict[str, Any]]) -> None:
+        """
+        Replace the rule set and rebuild the enabled, priority-sorted rules
+        evaluated for each event.
+        
+        Args:
+            rules_config: List of rule configurations
+        """
+        with self._rules_lock:
+            self.rules_config = rules_config
+            # Swapped in as a whole, so process_event never sees a half-built list;
+            # rules that can't be prepared are logged and left out
+            sorted_enabled_rules = []
+            for rule in sort_rules_by_priority(get_enabled_rules(rules_config)):
+                prepared = self._prepare_rule(rule)
+                if prepared is not None:
+                    sorted_enabled_rules.append(prepared)
+            
+            # Enabled rules per trigger event ID, each list still in priority order;
+            # rules naming an unknown event type can never fire and are left out
+            rules_by_event_id = defaultdict(list)
+            for rule in sorted_enabled_rules:
+                event_id = self._event_ids.get(rule.get('trigger', {}).get('event_type'))
+                if event_id is not None:
+                    rules_by_event_id[event_id].append(rule)
+            
+            # Number the rules for their execution counters, carrying counts over by name
+            for idx, rule in enumerate(sorted_enabled_rules):
+                rule['_idx'] = idx
+            rule_names = [rule.get('name') for rule in sorted_enabled_rules]
+            with self._stats_lock:
+                previous_counts = dict(zip(self._rule_names, self._rule_execution_counts))
+                self._rule_execution_counts = [previous_counts.get(name, 0) for name in rule_names]
+                self._rule_names = rule_names
+                self._sorted_enabled_rules = sorted_enabled_rules
+            self._rules_by_event_id: Dict[int, List[Dict[str, Any]]] = dict(rules_by_event_id)
+    
+    def _prepare_rule(self, rule: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Copy a rule with per-event derived values precomputed, leaving the
+        caller's rule dictionary untouched.
+        
+        Args:
+            rule: Rule configuration
+            
+        Returns:
+            Optional[Dict[str, Any]]: Shallow copy of the rule, or None if the
+            rule is malformed and can never match
+        """
+        try:
+            prepared = dict(rule)
+            trigger = rule.get('trigger', {})
+            if not isinstance(trigger, dict):
+                logger.error(f"Skipping rule '{rule.get('name')}': trigger is not an object")
+                return None
+            
+            if 'executable_name' in trigger:
+                executable_name = trigger['executable_name']
+                if not isinstance(executable_name, str):
+                    logger.error(f"Skipping rule '{rule.get('name')}': executable_name must be a string, "
+                                 f"got {executable_name!r}")
+                    return None
+                prepared['_expected_exe'] = executable_name.lower()
+            return prepared
+            
+        except Exception as e:
+            logger.error(f"Skipping invalid rule {rule!r}: {e}")
+            return None
     
     def _initialize_window_state(self):
         """Initialize the internal window state with currently open windows."""
         try:
-            logger.info("Initializing window state with currently open windows...")
+            if __debug__:
+                logger.info("Initializing window state with currently open windows...")
             
+            # GetWindowText and process lookups block on the target window's thread,
+            # so fetch window info concurrently rather than one window at a time
+            hwnds = list(enum_top_level_windows())
+            with ThreadPoolExecutor(max_workers=8, thread_name_prefix="WindowInfo") as executor:
+                window_infos = list(executor.map(get_window_info, hwnds))
+            # This process's own windows are left out: the event hooks never report them,
+            # so they would go stale (the polling fallback reports them as new windows)
+            own_pid = os.getpid()
+            found_windows = {hwnd: window_info for hwnd, window_info in zip(hwnds, window_infos)
+                             if window_info and window_info.get('title') and window_info.get('pid') != own_pid}
+            
+            # Enumerate without the lock; only publishing the merged state needs it
             with self._window_state_lock:
-                for hwnd in enum_top_level_windows():
-                    window_info = get_window_info(hwnd)
-                    if window_info and window_info.get('title'):
-                        self._internal_window_state[hwnd] = window_info
+                new_state = dict(self._internal_window_state)
+                new_state.update(found_windows)
+                
+                # Rebuild the indices in one pass rather than one copy per window
+                by_exe, by_class = {}, {}
+                for hwnd, window_info in new_state.items():
+                    by_exe.setdefault(self._exe_key(window_info), set()).add(hwnd)
+                    by_class.setdefault(window_info.get('class_name', ''), set()).add(hwnd)
+                
+                self._by_exe = {key: frozenset(hwnds) for key, hwnds in by_exe.items()}
+                self._by_class = {key: frozenset(hwnds) for key, hwnds in by_class.items()}
+                self._internal_window_state = new_state
                         
             logger.info(f"Initialized window state with {len(self._internal_window_state)} windows")
             
@@ -63,7 +203,71 @@ class RuleEngine:
     
     def process_event(self, event_id: int, hwnd: int, window_info: Dict[str, Any]) -> None:
         """
-        Process an incoming event from the EventMonitor.
+        Queue an incoming event from the EventMonitor for the worker thread.
+        Returns immediately; events are dropped (and counted) if the queue is full.
+        
+        Args:
+            event_id: Windows event ID
+            hwnd: Window handle
+            window_info: Window information dictionary
+        """
+        if self._stopped:
+            return
+        
+        try:
+            self._event_queue.put_nowait((event_id, hwnd, window_info))
+        except queue.Full:
+            self._dropped_events += 1
+            # Warnings flush the buffered log, so under overload report drops periodically
+            now = time.monotonic()
+            if now - self._last_drop_warning >= self.drop_warning_interval:
+                self._last_drop_warning = now
+                logger.warning("Event queue full, %d events dropped so far (latest for window %s)",
+                               self._dropped_events, hwnd)
+    
+    def _drain_events(self) -> None:
+        """Worker thread loop evaluating queued events in arrival order until stopped."""
+        while True:
+            item = self._event_queue.get()
+            if item is _STOP_WORKER:
+                break
+            self._process_event_impl(*item)
+    
+    def stop(self, timeout: float = 5.0) -> bool:
+        """
+        Stop the worker thread once the events already queued have been evaluated.
+        Call after the EventMonitor feeding process_event has stopped; later events are ignored.
+        
+        Args:
+            timeout: Seconds to wait for the worker to finish
+            
+        Returns:
+            bool: True if the worker has stopped
+        """
+        if self._stopped:
+            return not self._worker.is_alive()
+        self._stopped = True
+        
+        try:
+            if self._worker.is_alive():
+                # Blocks while the queue is full, so the sentinel itself is never dropped
+                self._event_queue.put(_STOP_WORKER, timeout=timeout)
+                self._worker.join(timeout)
+            
+            if self._worker.is_alive():
+                logger.warning("Rule engine worker did not stop in time")
+                return False
+            
+            logger.info("Rule engine stopped")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error stopping rule engine: {e}")
+            return False
+    
+    def _process_event_impl(self, event_id: int, hwnd: int, window_info: Dict[str, Any]) -> None:
+        """
+        Process an event: update window state and run matching rules.
         
         Args:
             event_id: Windows event ID
@@ -71,80 +275,169 @@ class RuleEngine:
             window_info: Window information dictionary
         """
         try:
-            self._event_count += 1
+            event_count = self._event_count = next(self._event_counter)
+            if event_count % self.status_log_interval == 0:
+                logger.info("Processed %d events, tracking %d windows",
+                            event_count, len(self._internal_window_state))
             
-            # Map event ID to event type
-            event_type = self.event_type_mapping.get(event_id, f"UNKNOWN_{event_id}")
+            # Event type name for logging and rule matching; None for events no rule can name
+            event_type = self.event_type_mapping.get(event_id)
             
-            logger.debug(f"Processing event {event_type} for window {window_info.get('title', 'Unknown')} (HWND: {hwnd})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processing event %s for window %s (HWND: %s)",
+                             event_type or f"UNKNOWN_{event_id}", window_info.get('title', 'Unknown'), hwnd)
             
             # Update internal window state
-            self._update_window_state(event_type, hwnd, window_info)
+            self._update_window_state(event_id, hwnd, window_info)
+            
+            # Most events (NAMECHANGE especially) trigger no rule at all; stop after the state update
+            event_rules = self._rules_by_event_id.get(event_id)
+            if not event_rules:
+                return
             
-            # Get enabled rules sorted by priority
-            enabled_rules = get_enabled_rules(self.rules_config)
-            sorted_rules = sort_rules_by_priority(enabled_rules)
+            # Computed once per event and shared by every rule's executable check; kept
+            # local because window_info may already be published in the window state
+            exe_name = self._exe_key(window_info)
             
-            # Evaluate rules
-            for rule in sorted_rules:
-                if self._match_rule_condition(rule, event_type, window_info):
+            # Evaluate only the enabled rules triggered by this event, in priority order
+            for rule in event_rules:
+                if self._match_rule_condition(rule, event_type, window_info, exe_name):
                     logger.info(f"Rule '{rule['name']}' matched for event {event_type}")
                     
                     # Get target windows for the action
                     target_windows = self._filter_target_windows(rule, window_info)
                     
                     if target_windows:
-                        # Execute the action
+                        # Execute the action; debounced actions report back once they have run
                         action_type = rule['action']['type']
-                        success = perform_action(action_type, target_windows, window_info)
+                        on_complete = partial(self._record_rule_result, rule, len(target_windows))
+                        success = perform_action(action_type, target_windows, window_info, on_complete)
                         
-                        if success:
-                            self._rule_execution_count[rule['name']] += 1
-                            logger.info(f"Successfully executed rule '{rule['name']}' on {len(target_windows)} windows")
+                        if success is None:
+                            logger.debug("Queued action for rule '%s'", rule['name'])
                         else:
-                            logger.warning(f"Failed to execute rule '{rule['name']}'")
+                            on_complete(success)
                     else:
-                        logger.debug(f"Rule '{rule['name']}' matched but no target windows found")
+                        logger.debug("Rule '%s' matched but no target windows found", rule['name'])
                         
         except Exception as e:
             logger.error(f"Error processing event: {e}")
     
-    def _update_window_state(self, event_type: str, hwnd: int, window_info: Dict[str, Any]) -> None:
+    def _record_rule_result(self, rule: Dict[str, Any], target_count: int, success: bool) -> None:
+        """
+        Count and log the outcome of a rule's action.
+        
+        Args:
+            rule: Prepared rule whose action ran
+            target_count: Number of target windows passed to the action
+            success: Whether the action succeeded
+        """
+        if success:
+            with self._stats_lock:
+                idx = rule['_idx']
+                # A rule from before a reload may no longer own this slot
+                if idx < len(self._sorted_enabled_rules) and self._sorted_enabled_rules[idx] is rule:
+                    self._rule_execution_counts[idx] += 1
+                self._rules_executed += 1
+            logger.info(f"Successfully executed rule '{rule['name']}' on {target_count} windows")
+        else:
+            logger.warning(f"Failed to execute rule '{rule['name']}'")
+    
+    def _update_window_state(self, event_id: int, hwnd: int, window_info: Dict[str, Any]) -> None:
         """
         Update the internal window state based on the event.
         
         Args:
-            event_type: Type of event (CREATE, DESTROY, etc.)
+            event_id: Windows event ID (EVENT_OBJECT_CREATE, EVENT_OBJECT_DESTROY, etc.)
             hwnd: Window handle
             window_info: Window information
         """
+        handler = self._state_handlers.get(event_id)
+        if handler is None:
+            return
+        
         with self._window_state_lock:
-            if event_type == "CREATE" or event_type == "SHOW":
-                # Add or update window in state
-                self._internal_window_state[hwnd] = window_info
-                logger.debug(f"Added/updated window {hwnd} in state")
-                
-            elif event_type == "DESTROY" or event_type == "HIDE":
-                # Remove window from state
-                if hwnd in self._internal_window_state:
-                    del self._internal_window_state[hwnd]
-                    logger.debug(f"Removed window {hwnd} from state")
-                    
-            elif event_type == "NAMECHANGE":
-                # Update window information
-                if hwnd in self._internal_window_state:
-                    self._internal_window_state[hwnd].update(window_info)
-                    logger.debug(f"Updated window {hwnd} information")
+            handler(hwnd, window_info)
+    
+    @staticmethod
+    def _exe_key(window_info: Dict[str, Any]) -> str:
+        """Get the lower-cased executable name of a window, or '' if unknown."""
+        exe_path = window_info.get('exe_path')
+        return os.path.basename(exe_path).lower() if exe_path else ''
+    
+    @staticmethod
+    def _index_with(index: Dict[str, FrozenSet[int]], key: str, hwnd: int) -> Dict[str, FrozenSet[int]]:
+        """Return a copy of index with hwnd added under key."""
+        new_index = dict(index)
+        new_index[key] = index.get(key, frozenset()) | {hwnd}
+        return new_index
+    
+    @staticmethod
+    def _index_without(index: Dict[str, FrozenSet[int]], key: str, hwnd: int) -> Dict[str, FrozenSet[int]]:
+        """Return a copy of index with hwnd removed from key, dropping empty keys."""
+        new_index = dict(index)
+        remaining = index.get(key, frozenset()) - {hwnd}
+        if remaining:
+            new_index[key] = remaining
+        else:
+            new_index.pop(key, None)
+        return new_index
+    
+    def _set_window(self, hwnd: int, window_info: Optional[Dict[str, Any]]) -> None:
+        """
+        Publish a new window state with hwnd set to window_info (or removed if None),
+        keeping the secondary indices in step. Caller must hold the state lock.
+        """
+        old_info = self._internal_window_state.get(hwnd)
+        by_exe, by_class = self._by_exe, self._by_class
+        
+        if old_info is not None:
+            by_exe = self._index_without(by_exe, self._exe_key(old_info), hwnd)
+            by_class = self._index_without(by_class, old_info.get('class_name', ''), hwnd)
+        if window_info is not None:
+            by_exe = self._index_with(by_exe, self._exe_key(window_info), hwnd)
+            by_class = self._index_with(by_class, window_info.get('class_name', ''), hwnd)
+        
+        new_state = dict(self._internal_window_state)
+        if window_info is None:
+            new_state.pop(hwnd, None)
+        else:
+            new_state[hwnd] = window_info
+        
+        self._by_exe, self._by_class = by_exe, by_class
+        self._internal_window_state = new_state
+    
+    def _store_window(self, hwnd: int, window_info: Dict[str, Any]) -> None:
+        """Add or update a window in state. Caller must hold the state lock."""
+        self._set_window(hwnd, window_info)
+        logger.debug("Added/updated window %s in state", hwnd)
+    
+    def _remove_window(self, hwnd: int, window_info: Dict[str, Any]) -> None:
+        """Remove a window from state. Caller must hold the state lock."""
+        if hwnd in self._internal_window_state:
+            self._set_window(hwnd, None)
+            logger.debug("Removed window %s from state", hwnd)
+        if window_info.get('class_name') == "CabinetWClass":
+            # Don't let duplicate-path checks see a closed explorer window
+            invalidate_explorer_cache()
+    
+    def _refresh_window(self, hwnd: int, window_info: Dict[str, Any]) -> None:
+        """Update a tracked window's information. Caller must hold the state lock."""
+        if hwnd in self._internal_window_state:
+            # Replace the entry rather than updating it, since readers may hold it
+            self._set_window(hwnd, {**self._internal_window_state[hwnd], **window_info})
+            logger.debug("Updated window %s information", hwnd)
     
     def _match_rule_condition(self, rule: Dict[str, Any], event_type: str, 
-                            window_info: Dict[str, Any]) -> bool:
+                            window_info: Dict[str, Any], exe_name: Optional[str] = None) -> bool:
         """
         Check if a window and event match a rule's trigger condition.
         
         Args:
             rule: Rule configuration
             event_type: Type of event
-            window_info: Window information
+            window_info: Window information; not modified
+            exe_name: Lower-cased executable name of the window, if already known
             
         Returns:
             bool: True if the rule condition is matched
@@ -156,30 +449,30 @@ class RuleEngine:
             if trigger.get('event_type') != event_type:
                 return False
             
-            # Check executable name if specified
-            if 'executable_name' in trigger:
-                expected_exe = trigger['executable_name'].lower()
-                window_exe = window_info.get('exe_path', '')
-                if window_exe:
-                    actual_exe = os.path.basename(window_exe).lower()
-                    if actual_exe != expected_exe:
-                        return False
-                else:
-                    return False
+            # Remaining checks run cheapest first, so most rejections skip the costly ones
             
-            # Check window class if specified
+            # Check window class if specified (plain string comparison)
             if 'window_class' in trigger:
                 expected_class = trigger['window_class']
                 actual_class = window_info.get('class_name', '')
                 if actual_class != expected_class:
                     return False
             
-            # Check window title pattern if specified
+            # Check executable name if specified (path split and lower-casing)
+            if 'executable_name' in trigger:
+                expected_exe = rule.get('_expected_exe') or trigger['executable_name'].lower()
+                actual_exe = exe_name if exe_name is not None else self._exe_key(window_info)
+                if not actual_exe or actual_exe != expected_exe:
+                    return False
+            
+            # Check window title pattern if specified (regex search, always last)
             if 'title_pattern' in trigger:
-                import re
                 pattern = trigger['title_pattern']
+                compiled = self._pattern_cache.get(pattern)
+                if compiled is None:
+                    compiled = self._pattern_cache.setdefault(pattern, re.compile(pattern))
                 title = window_info.get('title', '')
-                if not re.search(pattern, title):
+                if not compiled.search(title):
                     return False
             
             return True
@@ -204,16 +497,35 @@ class RuleEngine:
             action = rule.get('action', {})
             target_windows = []
             
-            with self._window_state_lock:
-                for hwnd, window_info in self._internal_window_state.items():
-                    # Skip the triggering window if specified
-                    if action.get('exclude_trigger_window', False):
-                        if hwnd == new_window_info.get('hwnd'):
-                            continue
-                    
-                    # Check if window should be included based on filters
-                    if self._window_matches_filter(window_info, action):
-                        target_windows.append(window_info)
+            # Lock-free snapshot; writers never modify a published state dict
+            window_state = self._internal_window_state
+            
+            # Narrow the scan to the tightest index the filter allows
+            candidate_hwnds = None
+            if action.get('same_executable', False):
+                trigger_exe = self._exe_key(new_window_info)
+                if not trigger_exe:
+                    # Without the trigger's executable no window can be shown to share it
+                    return []
+                candidate_hwnds = self._by_exe.get(trigger_exe, frozenset())
+            if 'window_class' in action:
+                class_hwnds = self._by_class.get(action['window_class'], frozenset())
+                candidate_hwnds = class_hwnds if candidate_hwnds is None else candidate_hwnds & class_hwnds
+            
+            if candidate_hwnds is None:
+                windows = window_state.items()
+            else:
+                windows = [(hwnd, window_state[hwnd]) for hwnd in candidate_hwnds if hwnd in window_state]
+            
+            for hwnd, window_info in windows:
+                # Skip the triggering window if specified
+                if action.get('exclude_trigger_window', False):
+                    if hwnd == new_window_info.get('hwnd'):
+                        continue
+                
+                # Check if window should be included based on filters
+                if self._window_matches_filter(window_info, action):
+                    target_windows.append(window_info)
             
             return target_windows
             
@@ -244,11 +556,13 @@ class RuleEngine:
                 if not window_info.get('is_top_level', False):
                     return False
             
-            # Check same executable requirement
-            if action.get('same_executable', False):
-                # This would need to be implemented based on the triggering window
-                # For now, we'll skip this check as it requires context
-                pass
+            # Check window class requirement
+            if 'window_class' in action:
+                if window_info.get('class_name', '') != action['window_class']:
+                    return False
+            
+            # same_executable depends on the triggering window, so it is applied
+            # through the executable index in _filter_target_windows
             
             return True
             
@@ -263,23 +577,30 @@ class RuleEngine:
         Returns:
             Dict[int, Dict[str, Any]]: Copy of window state
         """
-        with self._window_state_lock:
-            return self._internal_window_state.copy()
+        return self._internal_window_state.copy()
     
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about rule engine operation.
         
         Returns:
-            Dict[str, Any]: Statistics dictionary
+            Dict[str, Any]: Statistics dictionary. rule_execution_counts maps
+            each enabled rule's name to its execution count.
         """
-        with self._window_state_lock:
-            return {
-                'total_events_processed': self._event_count,
-                'current_windows_tracked': len(self._internal_window_state),
-                'rule_execution_counts': dict(self._rule_execution_count),
-                'enabled_rules': len(get_enabled_rules(self.rules_config))
-            }
+        rule_execution_counts = {}
+        with self._stats_lock:
+            for name, count in zip(self._rule_names, self._rule_execution_counts):
+                rule_execution_counts[name] = rule_execution_counts.get(name, 0) + count
+        
+        return {
+            'total_events_processed': self._event_count,
+            'total_rules_executed': self._rules_executed,
+            'current_windows_tracked': len(self._internal_window_state),
+            'queued_events': self._event_queue.qsize(),
+            'dropped_events': self._dropped_events,
+            'rule_execution_counts': rule_execution_counts,
+            'enabled_rules': sum(1 for _ in get_enabled_rules(self.rules_config))
+        }
     
     def refresh_window_state(self) -> None:
         """
@@ -293,6 +614,9 @@ class RuleEngine:
     
     def clear_statistics(self) -> None:
         """Clear execution statistics."""
-        self._event_count = 0
-        self._rule_execution_count.clear()
+        with self._stats_lock:
+            self._event_counter = itertools.count(1)
+            self._event_count = 0
+            self._rule_execution_counts = [0] * len(self._rule_names)
+            self._rules_executed = 0
         logger.info("Statistics cleared") 
\ No newline at end of file
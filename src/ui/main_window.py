@@ -7,7 +7,6 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 import threading
-import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -17,7 +16,7 @@ from ..core.process_manager import ProcessManager
 from ..core.window_manager import WindowManager
 from ..rules.engine import RuleEngine
 from ..rules.config import ConfigManager
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, flush_logs
 from ..utils.profiler import get_cpu_stats
 from ..utils.autostart import is_autostart_enabled, toggle_autostart
 from .welcome_dialog import show_welcome_dialog
@@ -620,6 +619,9 @@ class MainWindow:
     def _refresh_logs(self):
         """Refresh the log display"""
         try:
+            # Make sure buffered records are on disk before reading
+            flush_logs()
+            
             # Find the most recent log file
             logs_dir = Path("logs")
             if not logs_dir.exists():
@@ -674,14 +676,13 @@ class MainWindow:
         if self.system_tray:
             self.system_tray.start()
         
-        # Start stats update thread
-        def stats_thread():
-            while True:
-                self._update_stats()
-                time.sleep(1)
-        
-        self.stats_thread = threading.Thread(target=stats_thread, daemon=True)
-        self.stats_thread.start()
+        # Start stats updates on the Tk event loop
+        self._schedule_stats_update()
+    
+    def _schedule_stats_update(self):
+        """Refresh statistics and reschedule on the Tk event loop"""
+        self._update_stats()
+        self.root.after(1000, self._schedule_stats_update)
     
     def _update_stats(self):
         """Update statistics display"""
@@ -727,6 +728,9 @@ class MainWindow:
                 self.system_tray.stop()
             if self.event_monitor:
                 self.event_monitor.stop()
+            if self.rule_engine:
+                # Evaluate the events the monitor already queued before exiting
+                self.rule_engine.stop()
             self.root.quit()
     
     def run(self):
@@ -39,6 +39,7 @@ class SystemTray:
         self.tray_icon = None
         self.monitoring_thread = None
         self.running = False
+        self.stop_event = threading.Event()  # Wakes the monitoring thread on stop
         self.cpu_usage = 0.0
         self.event_log_window = None
         self.is_hidden = False
@@ -102,6 +103,7 @@ class SystemTray:
             
             # Start monitoring thread
             self.running = True
+            self.stop_event.clear()
             self.monitoring_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self.monitoring_thread.start()
             
@@ -113,6 +115,7 @@ class SystemTray:
     def stop(self):
         """Stop the system tray icon."""
         self.running = False
+        self.stop_event.set()
         
         if self.tray_icon:
             try:
@@ -175,10 +178,17 @@ class SystemTray:
     
     def _monitor_loop(self):
         """Monitor CPU usage and update tray icon."""
+        # Prime the counter so the non-blocking reads below measure the full period
+        psutil.cpu_percent(interval=None)
+        
         while self.running:
             try:
-                # Get CPU usage
-                self.cpu_usage = psutil.cpu_percent(interval=1)
+                # Update every 5 seconds, returning immediately once stop() is called
+                if self.stop_event.wait(5):
+                    break
+                
+                # Get CPU usage since the previous read
+                self.cpu_usage = psutil.cpu_percent(interval=None)
                 
                 # Update tray icon tooltip with status
                 if self.tray_icon and hasattr(self.tray_icon, 'title'):
@@ -186,12 +196,10 @@ class SystemTray:
                     status = "Hidden" if self.is_hidden else "Active"
                     tooltip = f"Desktop Manager Pro ({status})\nCPU: {self.cpu_usage:.1f}%\nEvents: {stats.get('total_events_processed', 0)}"
                     self.tray_icon.title = tooltip
-                    
-                time.sleep(5)  # Update every 5 seconds
                 
             except Exception as e:
                 logger.error(f"Error in tray monitoring: {e}")
-                time.sleep(10)
+                self.stop_event.wait(10)
     
     def show_event_log(self, icon=None, item=None):
         """Show a simple event log window."""
@@ -21,6 +21,9 @@ class LRUCache:
         self.cache: OrderedDict = OrderedDict()
         self.timestamps: Dict[str, float] = {}
         self.lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # Entries dropped to stay within max_size
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired"""
@@ -29,11 +32,14 @@ class LRUCache:
                 # Check if expired
                 if time.time() - self.timestamps[key] > self.ttl:
                     self._remove(key)
+                    self.misses += 1
                     return None
                 
                 # Move to end (most recently used)
                 self.cache.move_to_end(key)
+                self.hits += 1
                 return self.cache[key]
+            self.misses += 1
             return None
     
     def set(self, key: str, value: Any) -> None:
@@ -51,6 +57,7 @@ class LRUCache:
             if len(self.cache) > self.max_size:
                 oldest_key = next(iter(self.cache))
                 self._remove(oldest_key)
+                self.evictions += 1
     
     def _remove(self, key: str) -> None:
         """Remove key from cache"""
@@ -68,6 +75,10 @@ class LRUCache:
         """Get current cache size"""
         return len(self.cache)
     
+    def get_stats(self) -> Dict[str, int]:
+        """Get hit, miss and eviction counts"""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+    
     def cleanup_expired(self) -> int:
         """Remove expired entries and return count of removed items"""
         current_time = time.time()
@@ -151,7 +162,10 @@ class ExpensiveOperationCache:
             "window_info_cache_size": self.window_info_cache.size(),
             "total_cache_size": (self.exe_path_cache.size() + 
                                self.folder_path_cache.size() + 
-                               self.window_info_cache.size())
+                               self.window_info_cache.size()),
+            "exe_path_cache": self.exe_path_cache.get_stats(),
+            "folder_path_cache": self.folder_path_cache.get_stats(),
+            "window_info_cache": self.window_info_cache.get_stats()
         }
 
 
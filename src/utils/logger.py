@@ -1,31 +1,73 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 
 
-def setup_logger(name="desktop_manager", log_level=logging.INFO):
+class BufferedFileHandler(logging.handlers.MemoryHandler):
     """
-    Set up logging configuration for the desktop manager application.
+    MemoryHandler that also flushes once its oldest record exceeds flush_interval,
+    and at least every flush_interval seconds while the application is idle
+    """
+    
+    def __init__(self, target, capacity=50, flush_interval=2.0, flushLevel=logging.WARNING):
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self.flush_interval = flush_interval  # Seconds a record may wait in the buffer
+        # shouldFlush only runs when a record arrives, so a timer covers idle periods
+        self._stop_flushing = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_periodically, daemon=True,
+                                              name="LogFlush")
+        self._flush_thread.start()
+    
+    def shouldFlush(self, record):
+        return (super().shouldFlush(record) or
+                record.created - self.buffer[0].created >= self.flush_interval)
+    
+    def _flush_periodically(self):
+        """Write buffered records every flush_interval seconds until the handler is closed."""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+
+class InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a queue drained in the same process. Records are enqueued
+    as they are instead of being formatted by prepare(), so message formatting
+    runs on the listener thread. Arguments are therefore formatted slightly
+    later, and callers shouldn't change objects they pass as logging arguments.
+    """
+    
+    def prepare(self, record):
+        return record
+
+
+# Handlers shared by every logger so buffered records are written in order
+_handlers = []
+_listener = None
+
+
+def _create_handlers(log_level):
+    """
+    Create the file and console handlers shared by all application loggers.
     
     Args:
-        name (str): Logger name
-        log_level: Logging level (default: INFO)
+        log_level: Logging level for the console handler
     
     Returns:
-        logging.Logger: Configured logger instance
+        list: Configured handler instances
     """
     # Create logs directory if it doesn't exist
     log_dir = Path("E:/cursorprojects/desktop_manager/logs")
     log_dir.mkdir(exist_ok=True)
     
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(log_level)
-    
-    # Clear any existing handlers to avoid duplicates
-    logger.handlers.clear()
-    
     # Create formatters
     detailed_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
@@ -37,20 +79,63 @@ def setup_logger(name="desktop_manager", log_level=logging.INFO):
         datefmt='%H:%M:%S'
     )
     
-    # File handler
+    # File handler, buffered so records are written in batches
     log_file = log_dir / f"desktop_manager_{datetime.now().strftime('%Y%m%d')}.log"
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
+    buffered_file_handler = BufferedFileHandler(file_handler)
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(simple_formatter)
     
+    return [buffered_file_handler, console_handler]
+
+
+def _start_listener(log_level):
+    """
+    Route log records through a queue drained by a background writer thread,
+    so formatting and file/console I/O never run on the calling thread.
+    
+    Args:
+        log_level: Logging level for the console handler
+    """
+    global _listener
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, *_create_handlers(log_level), respect_handler_level=True
+    )
+    _listener.start()
+    # Drain outstanding records before logging shuts its handlers down
+    atexit.register(_listener.stop)
+    _handlers.append(InProcessQueueHandler(log_queue))
+
+
+def setup_logger(name="desktop_manager", log_level=logging.INFO):
+    """
+    Set up logging configuration for the desktop manager application.
+    
+    Args:
+        name (str): Logger name
+        log_level: Logging level (default: INFO)
+    
+    Returns:
+        logging.Logger: Configured logger instance
+    """
+    # Create logger
+    logger = logging.getLogger(name)
+    logger.setLevel(log_level)
+    
+    # Clear any existing handlers to avoid duplicates
+    logger.handlers.clear()
+    
     # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    if not _handlers:
+        _start_listener(log_level)
+    for handler in _handlers:
+        logger.addHandler(handler)
     
     return logger
 
@@ -72,5 +157,12 @@ def get_logger(name="desktop_manager"):
     return logger
 
 
+def flush_logs():
+    """Write any buffered log records to the log file."""
+    if _listener:
+        for handler in _listener.handlers:
+            handler.flush()
+
+
 # Create a default logger instance
 logger = get_logger() 
\ No newline at end of file
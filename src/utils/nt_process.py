@@ -0,0 +1,95 @@
+"""
+Whole-system process table snapshot via NtQuerySystemInformation.
+One call returns every PID and image name, instead of opening a handle per process.
+"""
+
+import ctypes
+from ctypes import wintypes
+from typing import Optional, Dict
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+ntdll = ctypes.WinDLL("ntdll")
+ntdll.NtQuerySystemInformation.restype = wintypes.ULONG  # NTSTATUS, compared unsigned
+ntdll.NtQuerySystemInformation.argtypes = [
+    wintypes.ULONG, ctypes.c_void_p, wintypes.ULONG, ctypes.POINTER(wintypes.ULONG)
+]
+
+SYSTEM_PROCESS_INFORMATION_CLASS = 5
+STATUS_SUCCESS = 0x00000000
+STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+_INITIAL_BUFFER_SIZE = 0x40000
+_MAX_BUFFER_SIZE = 0x4000000
+
+
+class UNICODE_STRING(ctypes.Structure):
+    _fields_ = [
+        ("Length", wintypes.USHORT),  # In bytes, excluding the terminator
+        ("MaximumLength", wintypes.USHORT),
+        ("Buffer", ctypes.c_void_p),
+    ]
+
+
+class SYSTEM_PROCESS_INFORMATION(ctypes.Structure):
+    """Leading, documented part of the per-process record"""
+    _fields_ = [
+        ("NextEntryOffset", wintypes.ULONG),
+        ("NumberOfThreads", wintypes.ULONG),
+        ("Reserved1", ctypes.c_byte * 48),
+        ("ImageName", UNICODE_STRING),
+        ("BasePriority", wintypes.LONG),
+        ("UniqueProcessId", ctypes.c_void_p),
+    ]
+
+
+# Last buffer size that fit, so later snapshots usually need a single call
+_buffer_size = _INITIAL_BUFFER_SIZE
+
+
+def snapshot_processes() -> Optional[Dict[int, str]]:
+    """
+    Read the whole process table with one NtQuerySystemInformation call.
+    
+    Returns:
+        Dict[int, str]: Mapping of PID to image name (e.g., "notepad.exe"),
+        or None if the query failed. Processes without an image name
+        (the idle process) are omitted.
+    """
+    global _buffer_size
+    
+    try:
+        size = _buffer_size
+        while size <= _MAX_BUFFER_SIZE:
+            buffer = ctypes.create_string_buffer(size)
+            return_length = wintypes.ULONG(0)
+            status = ntdll.NtQuerySystemInformation(
+                SYSTEM_PROCESS_INFORMATION_CLASS, buffer, size, ctypes.byref(return_length)
+            )
+            if status == STATUS_INFO_LENGTH_MISMATCH:
+                # Leave headroom for processes started before the retry
+                size = max(size * 2, return_length.value + 0x10000)
+                continue
+            if status != STATUS_SUCCESS:
+                logger.warning(f"NtQuerySystemInformation failed with status 0x{status:08X}")
+                return None
+            
+            _buffer_size = size
+            processes = {}
+            offset = 0
+            while True:
+                entry = SYSTEM_PROCESS_INFORMATION.from_buffer(buffer, offset)
+                image_name = entry.ImageName
+                if image_name.Buffer and image_name.Length:
+                    pid = entry.UniqueProcessId or 0
+                    processes[pid] = ctypes.wstring_at(image_name.Buffer, image_name.Length // 2)
+                if not entry.NextEntryOffset:
+                    break
+                offset += entry.NextEntryOffset
+            return processes
+        
+        logger.warning(f"Process table exceeds {_MAX_BUFFER_SIZE} bytes")
+        return None
+    except Exception as e:
+        logger.error(f"Error reading process table: {e}")
+        return None
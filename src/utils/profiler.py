@@ -8,6 +8,7 @@ import pstats
 import io
 import time
 import threading
+from array import array
 from typing import Optional, Callable
 from pathlib import Path
 from .logger import get_logger
@@ -74,27 +75,37 @@ class PerformanceProfiler:
 class CPUMonitor:
     """Monitor CPU usage patterns"""
     
-    def __init__(self, interval: float = 1.0):
+    def __init__(self, interval: float = 1.0, max_interval: float = 16.0,
+                 idle_threshold: float = 0.1):
         self.interval = interval
-        self.monitoring = False
+        self.max_interval = max_interval  # Upper bound for the idle back-off
+        self.idle_threshold = idle_threshold  # CPU % below which a sample counts as idle
+        self.current_interval = interval
+        self.high_cpu = False  # Whether the last sample was above the warning threshold
+        self.stop_event = threading.Event()  # Set to stop the monitoring thread
         self.thread = None
-        self.cpu_samples = []
         self.max_samples = 1000
+        # Preallocated ring buffer of (timestamp, cpu_percent) columns
+        self.sample_times = array('d', [0.0]) * self.max_samples
+        self.sample_values = array('d', [0.0]) * self.max_samples
+        self.sample_count = 0  # Total samples recorded since start
+        self.sample_sum = 0.0  # Running sum of the values currently buffered
         self.logger = logger
     
     def start_monitoring(self):
         """Start CPU monitoring"""
-        if self.monitoring:
+        if self.thread and self.thread.is_alive():
             return
         
-        self.monitoring = True
+        self.stop_event.clear()
+        self.current_interval = self.interval
         self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.thread.start()
         self.logger.info("CPU monitoring started")
     
     def stop_monitoring(self):
         """Stop CPU monitoring"""
-        self.monitoring = False
+        self.stop_event.set()
         if self.thread:
             self.thread.join(timeout=2.0)
         self.logger.info("CPU monitoring stopped")
@@ -106,37 +117,71 @@ class CPUMonitor:
         # Get the current process
         current_process = psutil.Process()
         
-        while self.monitoring:
+        # Prime the counter; the first non-blocking read has no baseline and is discarded
+        current_process.cpu_percent(interval=None)
+        next_deadline = time.monotonic()
+        
+        while not self.stop_event.is_set():
             try:
+                # Wait until an absolute deadline so loop overhead doesn't accumulate as drift;
+                # waiting on the stop event lets stop_monitoring() interrupt a long back-off
+                next_deadline += self.current_interval
+                delay = next_deadline - time.monotonic()
+                if delay > 0:
+                    if self.stop_event.wait(delay):
+                        break
+                else:
+                    # Fell behind (e.g. system resumed from sleep), restart the schedule
+                    next_deadline = time.monotonic()
+                
                 # Monitor the current process CPU usage, not system-wide
-                cpu_percent = current_process.cpu_percent(interval=self.interval)
+                cpu_percent = current_process.cpu_percent(interval=None)
                 timestamp = time.time()
                 
-                self.cpu_samples.append((timestamp, cpu_percent))
-                
-                # Keep only recent samples
-                if len(self.cpu_samples) > self.max_samples:
-                    self.cpu_samples = self.cpu_samples[-self.max_samples:]
+                # Overwrite the oldest slot once the buffer is full
+                index = self.sample_count % self.max_samples
+                if self.sample_count >= self.max_samples:
+                    self.sample_sum -= self.sample_values[index]
+                self.sample_sum += cpu_percent
+                self.sample_times[index] = timestamp
+                self.sample_values[index] = cpu_percent
+                self.sample_count += 1
+                if self.sample_count % self.max_samples == 0:
+                    # Recompute once per wrap so floating-point drift from the
+                    # add/subtract updates can't accumulate over long uptimes
+                    self.sample_sum = sum(self.sample_values)
                 
-                # Log high CPU usage (only for this process)
-                if cpu_percent > 5.0:  # Log when CPU > 5%
+                # Log high CPU usage (only for this process) once per high period
+                high_cpu = cpu_percent > 5.0  # Log when CPU > 5%
+                if high_cpu and not self.high_cpu:
                     self.logger.warning(f"High Desktop Manager CPU usage detected: {cpu_percent:.1f}%")
+                self.high_cpu = high_cpu
+                
+                # Back off while idle, return to the base rate on any activity
+                if cpu_percent < self.idle_threshold:
+                    self.current_interval = min(self.current_interval * 2, self.max_interval)
+                else:
+                    self.current_interval = self.interval
                     
             except Exception as e:
                 self.logger.error(f"Error in CPU monitoring: {e}")
-                time.sleep(self.interval)
+                self.stop_event.wait(self.interval)
     
     def get_cpu_stats(self) -> dict:
         """Get CPU usage statistics"""
-        if not self.cpu_samples:
+        if not self.sample_count:
             return {"current": 0.0, "average": 0.0, "max": 0.0, "min": 0.0}
         
-        current = self.cpu_samples[-1][1] if self.cpu_samples else 0.0
-        values = [sample[1] for sample in self.cpu_samples]
+        current = self.sample_values[(self.sample_count - 1) % self.max_samples]
+        # Reduce over the buffer in place once every slot holds a sample
+        if self.sample_count >= self.max_samples:
+            values = self.sample_values
+        else:
+            values = self.sample_values[:self.sample_count]
         
         return {
             "current": current,
-            "average": sum(values) / len(values),
+            "average": self.sample_sum / len(values),
             "max": max(values),
             "min": min(values),
             "samples": len(values)
@@ -144,7 +189,35 @@ class CPUMonitor:
     
     def get_recent_samples(self, count: int = 50) -> list:
         """Get recent CPU samples"""
-        return self.cpu_samples[-count:] if self.cpu_samples else []
+        return list(zip(self._recent(self.sample_times, count),
+                        self._recent(self.sample_values, count)))
+    
+    def save_samples(self, filepath: str) -> bool:
+        """
+        Save buffered samples as two contiguous float64 columns, oldest first:
+        all timestamps followed by all CPU values. Read back with
+        array('d').fromfile() or numpy.fromfile(path).reshape(2, -1).
+        """
+        try:
+            times = self._recent(self.sample_times, self.max_samples)
+            values = self._recent(self.sample_values, self.max_samples)
+            with open(filepath, 'wb') as f:
+                times.tofile(f)
+                values.tofile(f)
+            self.logger.info(f"Saved {len(values)} CPU samples to {filepath}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error saving CPU samples to {filepath}: {e}")
+            return False
+    
+    def _recent(self, column: array, count: int) -> array:
+        """Get the newest entries of a sample column, oldest first"""
+        count = min(count, self.sample_count, self.max_samples)
+        end = self.sample_count % self.max_samples
+        start = end - count
+        if start >= 0:
+            return column[start:end]
+        return column[start:] + column[:end]
 
 
 # Global profiler instance
@@ -180,4 +253,9 @@ def stop_cpu_monitoring():
 
 def get_cpu_stats() -> dict:
     """Get current CPU statistics"""
-    return cpu_monitor.get_cpu_stats() 
\ No newline at end of file
+    return cpu_monitor.get_cpu_stats()
+
+
+def save_cpu_samples(filepath: str) -> bool:
+    """Save the buffered CPU samples to a binary file"""
+    return cpu_monitor.save_samples(filepath) 
\ No newline at end of file
@@ -14,6 +14,20 @@ from .cache import cached_executable_path, cached_folder_path, cached_window_inf
 
 logger = get_logger(__name__)
 
+# Common system window classes to ignore
+SYSTEM_WINDOW_CLASSES = frozenset({
+    "Shell_TrayWnd",      # Taskbar
+    "Shell_SecondaryTrayWnd",  # Secondary taskbar
+    "NotifyIconOverflowWindow",  # System tray overflow
+    "Windows.UI.Core.CoreWindow",  # UWP apps
+    "ApplicationFrameWindow",  # UWP app frame
+    "ImmersiveLauncher",  # Start menu
+    "SearchUI",          # Windows search
+    "Shell_CharmWindow", # Charms bar
+    "MultitaskingViewFrame",  # Task view
+    "Shell_AppWnd",      # App windows
+})
+
 
 @cached_window_info
 def get_window_info(hwnd: int) -> Dict[str, Any]:
@@ -234,30 +248,29 @@ def is_system_window(hwnd: int) -> bool:
         class_name = win32gui.GetClassName(hwnd)
         title = win32gui.GetWindowText(hwnd)
         
-        # Common system window classes to ignore
-        system_classes = {
-            "Shell_TrayWnd",      # Taskbar
-            "Shell_SecondaryTrayWnd",  # Secondary taskbar
-            "NotifyIconOverflowWindow",  # System tray overflow
-            "Windows.UI.Core.CoreWindow",  # UWP apps
-            "ApplicationFrameWindow",  # UWP app frame
-            "ImmersiveLauncher",  # Start menu
-            "SearchUI",          # Windows search
-            "Shell_CharmWindow", # Charms bar
-            "MultitaskingViewFrame",  # Task view
-            "Shell_AppWnd",      # App windows
-        }
-        
-        return class_name in system_classes or not title
+        return class_name in SYSTEM_WINDOW_CLASSES or not title
     except Exception as e:
         logger.debug(f"Error checking if system window {hwnd}: {e}")
         return True
 
 
+def get_path_key(path: str) -> str:
+    """
+    Normalize a folder path for comparison (case, separators, trailing slash).
+    
+    Args:
+        path (str): Folder path
+        
+    Returns:
+        str: Comparison key, e.g. "c:\\foo" for both "C:\\Foo\\" and "c:/foo"
+    """
+    return os.path.normcase(os.path.normpath(path))
+
+
 def enum_explorer_windows_with_paths() -> list:
     """
     Enumerate all open explorer.exe windows and their canonical folder paths.
-    Returns a list of dicts: { 'hwnd': hwnd, 'path': canonical_path }
+    Returns a list of dicts: { 'hwnd': hwnd, 'path': canonical_path, 'path_key': comparison_key }
     """
     explorer_windows = []
     try:
@@ -268,7 +281,7 @@ def enum_explorer_windows_with_paths() -> list:
                 if class_name == "CabinetWClass":
                     path = get_explorer_folder_path(hwnd)
                     if path:
-                        explorer_windows.append({'hwnd': hwnd, 'path': path})
+                        explorer_windows.append({'hwnd': hwnd, 'path': path, 'path_key': get_path_key(path)})
             except Exception:
                 continue
     except Exception as e: